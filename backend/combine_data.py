@@ -1,10 +1,167 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 import os
 import glob
+import json
+from concurrent.futures import ThreadPoolExecutor
 
-def combine_csv_files(directory="data", output_file="data/combined_pba_data.csv"):
+# Highly repeated text columns. They are parsed straight into dictionary arrays
+# (categoricals in pandas), and Parquet stores each distinct value once with
+# integer codes per row instead of repeating the string.
+PBA_DICTIONARY_COLUMNS = ['name', 'tournament_name', 'center_name', 'pattern_name']
+
+# Column types for the PBA results schema. Declaring every column up front lets
+# the Arrow CSV reader skip type inference and convert values while parsing
+# instead of in separate pd.to_numeric / pd.to_datetime passes afterwards; the
+# integer-valued columns scraping can break are read as text and coerced below.
+# Columns missing from a file are simply ignored.
+PBA_COLUMN_TYPES = {
+    **{col: pa.dictionary(pa.int32(), pa.string()) for col in PBA_DICTIONARY_COLUMNS},
+    'start_date': pa.timestamp('ns', tz='UTC'),
+    'end_date': pa.timestamp('ns', tz='UTC'),
+    'center_location': pa.string(),
+    'pattern_length': pa.string(),
+    'pattern_volume': pa.float64(),
+    'pattern_ratio': pa.float64(),
+    'position': pa.string(),
+    'hometown': pa.string(),
+    'match_play_record': pa.string(),
+    'average': pa.float64(),
+    'points': pa.string(),
+    'earnings': pa.float64(),
+    'squad': pa.string(),
+    'score': pa.string(),
+    '+/-_200': pa.string(),
+}
+
+# Columns read as text and converted to numbers once the files are combined, like
+# pd.to_numeric(errors='coerce'): scraped values such as "DQ" or "T-5" become
+# missing instead of failing the parse of the whole file
+PBA_COERCED_NUMERIC_COLUMNS = ['position', 'pattern_length', 'score', '+/-_200']
+
+PBA_CONVERT_OPTIONS = pacsv.ConvertOptions(
+    column_types=PBA_COLUMN_TYPES,
+    timestamp_parsers=[pacsv.ISO8601, '%Y-%m-%d'],
+    strings_can_be_null=True,
+)
+
+# Fallback for a file whose float or date columns don't all parse: those columns
+# are read as text and converted afterwards, with bad values as nulls
+PBA_STRICT_COLUMN_TYPES = {
+    col: col_type for col, col_type in PBA_COLUMN_TYPES.items()
+    if pa.types.is_floating(col_type) or pa.types.is_timestamp(col_type)
+}
+PBA_LENIENT_CONVERT_OPTIONS = pacsv.ConvertOptions(
+    column_types={**PBA_COLUMN_TYPES, **{col: pa.string() for col in PBA_STRICT_COLUMN_TYPES}},
+    strings_can_be_null=True,
+)
+
+# Bump when the parsed schema changes so stale Feather caches are re-parsed
+CACHE_VERSION = 5
+
+# Bytes per record batch when streaming a CSV. Larger blocks parse with more
+# parallelism, smaller ones keep peak memory down. Column types not declared
+# above are inferred from the first block, so keep it large enough to be representative.
+CSV_BLOCK_SIZE = 8 << 20
+
+# Upper bound on files parsed at once. Arrow's CSV parser releases the GIL,
+# so threads overlap disk reads and tokenizing across files.
+MAX_READ_WORKERS = 8
+
+def _stream_csv(file, convert_options):
+    """
+    Stream one CSV file into an Arrow table batch by batch
+    """
+    reader = pacsv.open_csv(
+        file,
+        read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        convert_options=convert_options,
+    )
+    return pa.Table.from_batches(list(reader), schema=reader.schema)
+
+def _read_csv_file(file):
+    """
+    Read one CSV file with the PBA column types
+    A file with values the typed parse rejects is re-read leniently, so one bad
+    cell doesn't abort the whole combine
+    """
+    try:
+        return _stream_csv(file, PBA_CONVERT_OPTIONS)
+    except pa.ArrowInvalid as e:
+        print(f"Re-reading {file} leniently after a conversion error: {str(e)}")
+    
+    table = _stream_csv(file, PBA_LENIENT_CONVERT_OPTIONS)
+    for col, col_type in PBA_STRICT_COLUMN_TYPES.items():
+        if col in table.column_names:
+            idx = table.column_names.index(col)
+            values = table.column(idx).to_pandas()
+            if pa.types.is_timestamp(col_type):
+                values = pd.to_datetime(values, errors='coerce', utc=True, format='ISO8601')
+            else:
+                values = pd.to_numeric(values, errors='coerce')
+            table = table.set_column(idx, col, pa.array(values, type=col_type, from_pandas=True))
+    return table
+
+def _coerce_numeric(table, columns):
+    """
+    Convert text columns to numbers, with values that don't parse as nulls
+    """
+    for col in columns:
+        if col in table.column_names:
+            idx = table.column_names.index(col)
+            values = pd.to_numeric(table.column(idx).to_pandas(), errors='coerce')
+            table = table.set_column(idx, col, pa.array(values, from_pandas=True))
+    return table
+
+def _load_cache(cache_file):
+    """
+    Load the cached combined table, split back into per-file slices
+    Returns {file name: (mtime, table)}; empty if there is no usable cache
+    """
+    meta_file = f"{cache_file}.json"
+    if not os.path.exists(cache_file) or not os.path.exists(meta_file):
+        return {}
+    
+    try:
+        with open(meta_file) as f:
+            meta = json.load(f)
+        table = feather.read_table(cache_file)
+    except Exception as e:
+        print(f"Ignoring unreadable cache {cache_file}: {str(e)}")
+        return {}
+    
+    if meta.get('version') != CACHE_VERSION:
+        print(f"Ignoring cache {cache_file} written with an older schema")
+        return {}
+    
+    # Rows are stored in file order, so the recorded row counts give each file's slice
+    slices = {}
+    offset = 0
+    for entry in meta['files']:
+        slices[entry['name']] = (entry['mtime'], table.slice(offset, entry['rows']))
+        offset += entry['rows']
+    return slices
+
+def _save_cache(cache_file, table, file_entries):
+    """
+    Write the combined table as Feather plus a sidecar JSON of per-file mtimes
+    """
+    feather.write_feather(table, cache_file, compression='zstd')
+    with open(f"{cache_file}.json", 'w') as f:
+        json.dump({'version': CACHE_VERSION, 'files': file_entries}, f, indent=2)
+
+def combine_csv_files(directory="data", output_file="data/combined_pba_data.csv", cache_file=None,
+                      parquet_file=None, emit_csv=True):
     """
     Combines all PBA results CSV files in the specified directory
+    Parsed data is cached in a Feather file so reruns only re-read CSVs that changed
+    
+    The combined data is written as Parquet (next to output_file unless parquet_file
+    is given) and, unless emit_csv is False, as CSV for the tools that read it
     """
     print("Combining PBA data files...")
     
@@ -17,36 +174,85 @@ def combine_csv_files(directory="data", output_file="data/combined_pba_data.csv"
     
     print(f"Found {len(csv_files)} CSV files: {csv_files}")
     
-    # Read and combine all CSV files
-    combined_df = pd.concat([pd.read_csv(file) for file in csv_files], ignore_index=True)
+    if cache_file is None:
+        cache_file = os.path.join(directory, "combined_pba_data.feather")
+    cached = _load_cache(cache_file)
+    
+    # Reuse the cached rows of every file whose mtime is unchanged, re-read the rest
+    mtimes = {file: os.path.getmtime(file) for file in csv_files}
+    reread = []
+    for file in csv_files:
+        name = os.path.basename(file)
+        if name not in cached or cached[name][0] != mtimes[file]:
+            reread.append(file)
+    
+    # Parse the new or changed files in parallel; map() keeps them in order
+    parsed = {}
+    if reread:
+        with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(reread))) as executor:
+            parsed = dict(zip(reread, executor.map(_read_csv_file, reread)))
+    
+    tables = []
+    file_entries = []
+    for file in csv_files:
+        name = os.path.basename(file)
+        file_table = parsed[file] if file in parsed else cached[name][1]
+        tables.append(file_table)
+        file_entries.append({'name': name, 'mtime': mtimes[file], 'rows': file_table.num_rows})
+    
+    # Nothing to write if no file changed and none were removed
+    unchanged = not reread and len(cached) == len(csv_files)
+    if reread:
+        print(f"Parsed {len(reread)} new or changed CSV files: {reread}")
+    elif unchanged:
+        print(f"All CSV files unchanged, using cached data from {cache_file}")
+    else:
+        print(f"{len(cached) - len(csv_files)} CSV files were removed, using cached data for the rest from {cache_file}")
+    
+    # Concatenate the column chunks. promote_options fills columns missing
+    # from a file with nulls and matches columns by name, like pd.concat did.
+    table = pa.concat_tables(tables, promote_options='default')
     
     # Clean up the data
     # Convert match play record back to normal format if it has quotes
-    if 'match_play_record' in combined_df.columns:
-        combined_df['match_play_record'] = combined_df['match_play_record'].str.replace("'", "")
+    if 'match_play_record' in table.column_names:
+        idx = table.column_names.index('match_play_record')
+        cleaned = pc.replace_substring(table.column(idx), "'", "")
+        table = table.set_column(idx, 'match_play_record', cleaned)
+    
+    # earnings and the date columns were typed during parsing. The cache keeps the
+    # parsed text, so cached and newly parsed files always concatenate cleanly.
+    typed_table = _coerce_numeric(table, PBA_COERCED_NUMERIC_COLUMNS)
+    combined_df = typed_table.to_pandas()
     
-    # Convert position to numeric
-    if 'position' in combined_df.columns:
-        combined_df['position'] = pd.to_numeric(combined_df['position'], errors='coerce')
+    if parquet_file is None:
+        parquet_file = os.path.splitext(output_file)[0] + ".parquet"
+    outputs = [parquet_file, output_file] if emit_csv else [parquet_file]
     
-    # Convert earnings to numeric
-    if 'earnings' in combined_df.columns:
-        combined_df['earnings'] = pd.to_numeric(combined_df['earnings'], errors='coerce')
+    if unchanged and all(os.path.exists(f) for f in outputs):
+        print(f"Combined data in {', '.join(outputs)} is up to date ({len(combined_df)} total results)")
+        return combined_df
     
-    # Convert dates to datetime
-    for date_col in ['start_date', 'end_date']:
-        if date_col in combined_df.columns:
-            combined_df[date_col] = pd.to_datetime(combined_df[date_col], errors='coerce')
+    _save_cache(cache_file, table, file_entries)
     
     # Save the combined data
-    combined_df.to_csv(output_file, index=False)
-    print(f"Saved combined data to {output_file} with {len(combined_df)} total results")
+    dictionary_columns = [col for col in PBA_DICTIONARY_COLUMNS if col in typed_table.column_names]
+    pq.write_table(typed_table, parquet_file, compression='zstd', use_dictionary=dictionary_columns)
+    if emit_csv:
+        combined_df.to_csv(output_file, index=False)
+    print(f"Saved combined data to {', '.join(outputs)} with {len(combined_df)} total results")
     
     return combined_df
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Combine yearly PBA results CSV files")
+    parser.add_argument("--parquet-only", action="store_true", help="Write only the Parquet output, skip the CSV")
+    args = parser.parse_args()
+    
     # Combine all CSV files
-    combined_data = combine_csv_files()
+    combined_data = combine_csv_files(emit_csv=not args.parquet_only)
     
     if combined_data is not None:
         # Print some summary stats
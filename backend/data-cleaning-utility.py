@@ -1,28 +1,346 @@
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import re
 import os
 
-def clean_pba_data(input_file, output_file=None):
+# Tournament classification patterns, matched against lowercased tournament names.
+# Compiled once here rather than on every str.contains call.
+_PTQ_RE = re.compile(r'ptq|qualifier|qualifying')
+_MAJOR_RE = re.compile(r'major|masters|us open|pba world|tournament of champions|players championship')
+_REG_RE = re.compile(r'regional|challenge|trial')
+_REG2_RE = re.compile(r'regional|challenge')
+
+# Center indicators in venue names
+_CENTER_RE = re.compile(r'lanes|bowl|alley|center|plaza', re.IGNORECASE)
+
+# Venue hints in tournament names, e.g. "... at Bowlero Jupiter" or "... in Las Vegas"
+_AT_LOCATION_RE = re.compile(r'\bat\s+([^,]+)')
+_IN_LOCATION_RE = re.compile(r'\bin\s+([^,]+)')
+
+# Pattern length categories: Short: 0-36, Medium: 37-41, Long: 42-47, Extra Long: 48-100
+# Bins are right-closed like pd.cut; lengths outside (0, 100] or missing get no category
+_PATTERN_LENGTH_EDGES = np.array([0, 36, 41, 47, 100])
+_PATTERN_CATEGORIES = ['Short', 'Medium', 'Long', 'Extra Long']
+
+# Name casing helpers: generational suffixes, letters that start a word part
+# ("o'neill" -> "O'Neill", "lavery-spahr" -> "Lavery-Spahr", "t.j." -> "T.J.") and Mc prefixes
+_ROMAN_NUMERAL_RE = re.compile(r'^(?:ii|iii|iv)$', re.IGNORECASE)
+_WORD_START_RE = re.compile(r"(^|['.-])(\w)")
+_MC_PREFIX_RE = re.compile(r'^Mc(\w)')
+
+# Strings that parse as a plain decimal number; anything else is treated as missing
+_NUMBER_PATTERN = r'^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$'
+
+def _case_name_part(part):
     """
-    Comprehensive data cleaning for PBA tournament data
+    Capitalize one word of a bowler name without flattening deliberate capitals
+    (e.g., "mcdonald" -> "McDonald" but "DeVore", "EJ" and "III" stay as they are)
+    """
+    if _ROMAN_NUMERAL_RE.match(part):
+        return part.upper()
     
-    Args:
-        input_file: Path to the input CSV file
-        output_file: Path to the output CSV file (if None, will use input_file)
+    # Inner capitals are intentional unless the whole word is shouted ("SMITH")
+    shouting = part.isupper() and sum(c.isalpha() for c in part) >= 3
+    if not shouting and part[1:] != part[1:].lower():
+        return part
     
-    Returns:
-        Cleaned DataFrame
+    part = _WORD_START_RE.sub(lambda m: m.group(1) + m.group(2).upper(), part.lower())
+    return _MC_PREFIX_RE.sub(lambda m: 'Mc' + m.group(1).upper(), part)
+
+def _clean_name(name, corrections):
     """
-    print(f"Cleaning data from {input_file}...")
+    Normalize one bowler name: collapse whitespace, fix capitalization
+    (e.g., "john  smith" -> "John Smith", "ethan mcdonald" -> "Ethan McDonald")
+    and apply known corrections
+    """
+    if not isinstance(name, str):
+        return np.nan
+    # str.split() trims and collapses whitespace runs in one C-level pass
+    name = ' '.join(_case_name_part(part) for part in name.split())
+    return corrections.get(name, name)
+
+def _strip_to_numeric(series, strip_chars):
+    """
+    Remove the given characters from a column and parse it as float64 using Arrow string kernels
+    Values that are not numbers become NaN, like pd.to_numeric(errors='coerce')
+    """
+    # Already numeric, nothing to strip
+    if pd.api.types.is_numeric_dtype(series):
+        return series
     
-    if not os.path.exists(input_file):
-        print(f"Error: File {input_file} not found!")
-        return None
+    arr = pa.array(series.astype('string'))
+    for char in strip_chars:
+        arr = pc.replace_substring(arr, char, '')
+    arr = pc.utf8_trim_whitespace(arr)
+    arr = pc.if_else(pc.match_substring_regex(arr, _NUMBER_PATTERN), arr, pa.scalar(None, pa.string()))
+    return pd.Series(pc.cast(arr, pa.float64()).to_numpy(zero_copy_only=False), index=series.index)
+
+def _broadcast_categories(series, per_category, missing):
+    """
+    Expand a per-category result back to one value per row through the category codes
+    Rows with a missing value (code -1) get `missing`
+    """
+    per_category = np.append(np.asarray(per_category), missing)
+    return per_category[series.cat.codes.to_numpy()]
+
+def _encode_text_columns(df):
+    """
+    Encode the heavily repeated text columns as categories so the string cleanup
+    runs once per unique value. center_name is encoded after its fixup rewrites it.
+    """
+    for col in ['name', 'tournament_name', 'pattern_name']:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+def _build_location_mapping(df):
+    """
+    Build the tournament_name -> venue lookup used to fix center names
+    Only needs the tournament_name and center_name columns, but must see all rows
+    """
+    # Create a location lookup dictionary (tournament_name -> center_name)
+    location_mapping = {}
     
-    # Load the data
-    df = pd.read_csv(input_file)
-    original_rows = len(df)
-    print(f"Loaded {original_rows} rows")
+    # First pass - extract clear bowling centers
+    # One groupby collects each center's tournaments; centers come in order of first
+    # appearance and later centers win, as in the old per-center loop
+    by_center = df.dropna(subset=['tournament_name']).groupby('center_name', sort=False, observed=True)['tournament_name'].unique()
+    for center, tournaments in by_center.items():
+        if _CENTER_RE.search(center):
+            for tournament in tournaments:
+                location_mapping[tournament] = center
+    
+    # Second pass - extract from tournament names that contain location info
+    # Look for "at" or "in" followed by a location, preferring "at" when both appear
+    tournaments = pd.Series(df['tournament_name'].dropna().unique(), dtype=object)
+    tournaments = tournaments[~tournaments.isin(location_mapping.keys())]
+    at_location = tournaments.str.extract(_AT_LOCATION_RE, expand=False)
+    in_location = tournaments.str.extract(_IN_LOCATION_RE, expand=False)
+    locations = at_location.fillna(in_location)
+    found = locations.notna()
+    location_mapping.update(zip(tournaments[found], (location.strip() for location in locations[found])))
+    
+    return location_mapping
+
+def _fix_center_names(df, location_mapping):
+    """
+    Apply the location lookup where center_name is missing or repeats the tournament name
+    """
+    # Venues get new values here, so work on plain strings even if the
+    # column arrived as a categorical
+    if isinstance(df['center_name'].dtype, pd.CategoricalDtype):
+        df['center_name'] = df['center_name'].astype(object)
+    
+    # Apply the mapping where center_name is missing or same as tournament name
+    # Each tournament is looked up once per category and broadcast to its rows
+    tournaments = df['tournament_name']
+    mapped = _broadcast_categories(tournaments, tournaments.cat.categories.map(location_mapping), np.nan)
+    mapped = pd.Series(mapped, index=df.index)
+    needs_fix = df['center_name'].isna() | (df['center_name'] == tournaments)
+    df['center_name'] = df['center_name'].mask(needs_fix & mapped.notna(), mapped)
+            
+    # For remaining rows, if center_name == tournament_name, make it "Unknown"
+    mask = df['center_name'] == tournaments
+    df.loc[mask, 'center_name'] = 'Unknown Venue'
+
+def _fix_bowler_names(df):
+    """
+    Fix duplicate bowler names (capitalization, spacing, common misspellings)
+    """
+    # Common name variations and corrections
+    name_corrections = {
+        # Format: 'incorrect': 'correct'
+        'Zachary Tackett': 'Zac Tackett',
+        'Tom Daughterty': 'Tom Daugherty',
+        # Add more name corrections as needed
+    }
+    
+    # Clean each category once, so the cost follows the number of bowlers rather
+    # than the number of rows. Several spellings can clean to the same name, so the
+    # old codes are remapped onto the merged categories instead of renamed in place.
+    cleaned_names = pd.Index([_clean_name(name, name_corrections) for name in df['name'].cat.categories])
+    new_categories = cleaned_names.dropna().unique()
+    new_codes = _broadcast_categories(df['name'], new_categories.get_indexer(cleaned_names), -1)
+    df['name'] = pd.Categorical.from_codes(new_codes, categories=new_categories)
+
+def _standardize_patterns(df):
+    """
+    Apply standard lengths for known oil patterns and add a pattern length category
+    """
+    # Known pattern names and their standard lengths
+    pattern_standards = {
+        'cheetah': 35,
+        'wolf': 33,
+        'chameleon': 41,
+        'scorpion': 42,
+        'shark': 48,
+        'bear': 40,
+        'dragon': 45,
+        'viper': 39,
+        'us open': 45,
+        'masters': 40,
+        'toc': 43,
+        'tournament of champions': 43,
+        'mike aulby': 39,
+        'amleto monacelli': 40,
+        'billy hardwick': 44,
+        'don johnson': 40,  # Specifically fixing Don Johnson pattern
+        'earl anthony': 43,
+        'don carter': 37,
+        'wayne webb': 38,
+        'carmen salvino': 42,
+        'dick weber': 45
+    }
+    
+    # A chunk whose pattern names are all missing has no categories to match
+    if len(df['pattern_name'].cat.categories) > 0:
+        # Pattern name normalization (lowercase and trim), done once per category
+        pname_lower = df['pattern_name'].cat.categories.str.lower().str.strip()
+    
+        # Apply standard lengths for known patterns
+        # A single alternation regex (longest names first) finds the known pattern in
+        # each name, covering exact matches and variations like "Don Johnson 40"
+        known_names = '|'.join(re.escape(pattern) for pattern in sorted(pattern_standards, key=len, reverse=True))
+        known_pattern = pname_lower.str.extract(fr'\b({known_names})\b', expand=False)
+        standard_lengths = np.asarray(
+            _broadcast_categories(df['pattern_name'], known_pattern.map(pattern_standards), np.nan), dtype=float
+        )
+        # Only the matched rows are written, so an integer length column stays integer
+        matched = ~np.isnan(standard_lengths)
+        df.loc[matched, 'pattern_length'] = standard_lengths[matched]
+    
+    # Add pattern category based on length
+    # A binary search against the bin edges gives each length's bin directly
+    codes = np.searchsorted(_PATTERN_LENGTH_EDGES, df['pattern_length'].to_numpy(dtype=float), side='left') - 1
+    codes[codes >= len(_PATTERN_CATEGORIES)] = -1  # above 100 or NaN
+    df['pattern_category'] = pd.Categorical.from_codes(codes, categories=_PATTERN_CATEGORIES, ordered=True)
+
+def _classify_tournaments(df):
+    """
+    Add the is_ptq flag and tournament_tier column from the tournament name
+    """
+    # Lowercase the unique names once and evaluate each classification pattern a
+    # single time on them, then broadcast the boolean masks to the rows
+    tournaments = df['tournament_name']
+    tn_lower = tournaments.cat.categories.str.lower()
+    is_ptq = _broadcast_categories(tournaments, tn_lower.str.contains(_PTQ_RE), False)
+    is_major = _broadcast_categories(tournaments, tn_lower.str.contains(_MAJOR_RE), False)
+    is_regional_like = _broadcast_categories(tournaments, tn_lower.str.contains(_REG_RE), False)
+    is_regional = _broadcast_categories(tournaments, tn_lower.str.contains(_REG2_RE), False)
+    
+    # Identify PTQ events vs main tournaments
+    df['is_ptq'] = is_ptq
+    
+    # Add a field for tournament tier
+    conditions = [
+        # Major tournaments
+        is_major,
+        # Standard tournaments
+        ~is_ptq & ~is_regional_like,
+        # PTQ/Qualifiers
+        is_ptq,
+        # Regionals/Challenges
+        is_regional
+    ]
+    
+    choices = ['Major', 'Standard', 'Qualifier', 'Regional']
+    df['tournament_tier'] = np.select(conditions, choices, default='Other')
+
+def _final_cleanup(df):
+    """
+    Convert data types and handle missing values
+    """
+    # Convert position to numeric (handling 'T' prefix for ties)
+    if 'position' in df.columns:
+        df['position'] = _strip_to_numeric(df['position'], ['T'])
+    
+    # Convert earnings to numeric
+    if 'earnings' in df.columns:
+        df['earnings'] = _strip_to_numeric(df['earnings'], ['$', ','])
+    
+    # Convert dates to datetime
+    for date_col in ['start_date', 'end_date']:
+        if date_col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+            df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
+    
+    # Handle missing values with one fill over all numeric columns
+    numeric_cols = df.select_dtypes(include=['number']).columns
+    fill_values = {col: 0 for col in numeric_cols if col != 'position'}  # Don't fill position
+    df.fillna(fill_values, inplace=True)
+
+def _clean_chunk(df, location_mapping):
+    """
+    Run every row-local cleaning step on one chunk, given the global location lookup
+    """
+    _encode_text_columns(df)
+    if location_mapping is not None:
+        _fix_center_names(df, location_mapping)
+    if 'center_name' in df.columns:
+        df['center_name'] = df['center_name'].astype('category')
+    if 'name' in df.columns:
+        _fix_bowler_names(df)
+    if 'pattern_name' in df.columns and 'pattern_length' in df.columns:
+        _standardize_patterns(df)
+    if 'tournament_name' in df.columns:
+        _classify_tournaments(df)
+    _final_cleanup(df)
+    return df
+
+def _scan_csv(input_file, chunk_rows):
+    """
+    Stream the file once to settle a single dtype per column and collect the
+    distinct (tournament_name, center_name) pairs the center lookup needs
+    Chunks infer types independently, so a column that is empty in one chunk
+    would otherwise come back as float there and text elsewhere.
+    """
+    seen_dtypes = {}
+    pairs = []
+    for chunk in pd.read_csv(input_file, chunksize=chunk_rows):
+        for col in chunk.columns:
+            seen_dtypes.setdefault(col, [])
+            if chunk[col].notna().any():
+                seen_dtypes[col].append(chunk[col].dtype)
+        if 'center_name' in chunk.columns and 'tournament_name' in chunk.columns:
+            # Keeping first occurrences preserves the order the lookup depends on
+            pairs.append(chunk[['tournament_name', 'center_name']].drop_duplicates())
+    
+    # Columns that are empty everywhere stay float, as a full read would leave them
+    dtypes = {col: np.result_type(*found) if found else np.float64 for col, found in seen_dtypes.items()}
+    centers = pd.concat(pairs, ignore_index=True).drop_duplicates() if pairs else None
+    return dtypes, centers
+
+def _clean_pba_data_chunked(input_file, output_file, chunk_rows):
+    """
+    Clean the data in chunks of chunk_rows rows, appending each to output_file
+    Only the dtypes and center lookup need the whole file, and both are gathered
+    in a streaming pre-pass. Returns the tournament tier counts, since the full
+    frame is never held in memory.
+    """
+    print("Scanning column types and center names...")
+    dtypes, centers = _scan_csv(input_file, chunk_rows)
+    location_mapping = _build_location_mapping(centers) if centers is not None else None
+    
+    # Write to a temporary file so cleaning in place does not truncate the input
+    tmp_file = f"{output_file}.tmp"
+    total_rows = 0
+    tier_counts = pd.Series(dtype='int64')
+    for i, chunk in enumerate(pd.read_csv(input_file, chunksize=chunk_rows, dtype=dtypes)):
+        chunk = _clean_chunk(chunk, location_mapping)
+        chunk.to_csv(tmp_file, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+        total_rows += len(chunk)
+        if 'tournament_tier' in chunk.columns:
+            tier_counts = tier_counts.add(chunk['tournament_tier'].value_counts(), fill_value=0)
+    os.replace(tmp_file, output_file)
+    
+    print(f"Cleaned {total_rows} rows in chunks of {chunk_rows}")
+    return tier_counts.astype('int64').sort_values(ascending=False)
+
+def _clean_pba_frame(df):
+    """
+    Run every cleaning step on a loaded DataFrame, reporting the changes
+    """
+    _encode_text_columns(df)
     
     # 1. Fix center names - separate tournament venues from tournament names
     if 'center_name' in df.columns and 'tournament_name' in df.columns:
@@ -30,81 +348,21 @@ def clean_pba_data(input_file, output_file=None):
         # Count current unique values
         orig_centers = df['center_name'].nunique()
         
-        # Create a location lookup dictionary (tournament_name -> center_name)
-        location_mapping = {}
-        
-        # Look for center indicators in the data
-        center_keywords = ['lanes', 'bowl', 'alley', 'center', 'plaza']
-        
-        # First pass - extract clear bowling centers
-        for center in df['center_name'].dropna().unique():
-            # Check if this looks like an actual bowling center
-            is_center = any(keyword in center.lower() for keyword in center_keywords)
-            
-            if is_center:
-                # Find tournaments at this center
-                tournaments = df[df['center_name'] == center]['tournament_name'].unique()
-                for tournament in tournaments:
-                    location_mapping[tournament] = center
-        
-        # Second pass - extract from tournament names that contain location info
-        for tournament in df['tournament_name'].dropna().unique():
-            # Skip if already mapped
-            if tournament in location_mapping:
-                continue
-                
-            # Look for "at" or "in" followed by a location
-            at_match = re.search(r'\bat\s+([^,]+)', tournament)
-            in_match = re.search(r'\bin\s+([^,]+)', tournament)
-            
-            if at_match:
-                location = at_match.group(1).strip()
-                location_mapping[tournament] = location
-            elif in_match:
-                location = in_match.group(1).strip()
-                location_mapping[tournament] = location
-                
-        # Apply the mapping where center_name is missing or same as tournament name
-        for tournament, location in location_mapping.items():
-            mask = (df['tournament_name'] == tournament) & (
-                df['center_name'].isna() | 
-                (df['center_name'] == tournament)
-            )
-            if mask.any():
-                df.loc[mask, 'center_name'] = location
-                
-        # For remaining rows, if center_name == tournament_name, make it "Unknown"
-        mask = df['center_name'] == df['tournament_name']
-        df.loc[mask, 'center_name'] = 'Unknown Venue'
+        _fix_center_names(df, _build_location_mapping(df))
         
         # Report changes
         new_centers = df['center_name'].nunique()
         print(f"Center names: {orig_centers} unique values -> {new_centers} unique values")
     
+    if 'center_name' in df.columns:
+        df['center_name'] = df['center_name'].astype('category')
+    
     # 2. Fix duplicate bowler names (common misspellings)
     if 'name' in df.columns:
         print("Fixing bowler names...")
         orig_bowlers = df['name'].nunique()
         
-        # Common name variations and corrections
-        name_corrections = {
-            # Format: 'incorrect': 'correct'
-            'Zac Tackett': 'Zac Tackett',
-            'Zachary Tackett': 'Zac Tackett',
-            'Tom Daugherty': 'Tom Daugherty',
-            'Tom Daughterty': 'Tom Daugherty',
-            # Add more name corrections as needed
-        }
-        
-        # Apply name corrections
-        df['name'] = df['name'].replace(name_corrections)
-        
-        # Fix capitalization variations (e.g., "john smith" -> "John Smith")
-        df['name'] = df['name'].str.title()
-        
-        # Remove extra spaces
-        df['name'] = df['name'].str.strip()
-        df['name'] = df['name'].replace(r'\s+', ' ', regex=True)
+        _fix_bowler_names(df)
         
         # Report changes
         new_bowlers = df['name'].nunique()
@@ -115,54 +373,7 @@ def clean_pba_data(input_file, output_file=None):
         print("Standardizing oil patterns...")
         orig_patterns = df['pattern_name'].nunique()
         
-        # Known pattern names and their standard lengths
-        pattern_standards = {
-            'cheetah': 35,
-            'wolf': 33,
-            'chameleon': 41,
-            'scorpion': 42,
-            'shark': 48,
-            'bear': 40,
-            'dragon': 45,
-            'viper': 39,
-            'us open': 45,
-            'masters': 40,
-            'toc': 43,
-            'tournament of champions': 43,
-            'mike aulby': 39,
-            'amleto monacelli': 40,
-            'billy hardwick': 44,
-            'don johnson': 40,  # Specifically fixing Don Johnson pattern
-            'earl anthony': 43,
-            'don carter': 37,
-            'wayne webb': 38,
-            'carmen salvino': 42,
-            'dick weber': 45
-        }
-        
-        # Pattern name normalization (lowercase and trim)
-        df['pattern_name_lower'] = df['pattern_name'].str.lower().str.strip()
-        
-        # Apply standard lengths for known patterns
-        for pattern, length in pattern_standards.items():
-            # Exact match on lowercase name
-            mask = df['pattern_name_lower'] == pattern
-            df.loc[mask, 'pattern_length'] = length
-            
-            # Contains pattern name (for variations like "Don Johnson 40")
-            contains_mask = df['pattern_name_lower'].str.contains(fr'\b{re.escape(pattern)}\b', regex=True, na=False)
-            df.loc[contains_mask, 'pattern_length'] = length
-        
-        # Remove temporary column
-        df = df.drop(columns=['pattern_name_lower'])
-        
-        # Add pattern category based on length
-        # Short: 0-36, Medium: 37-41, Long: 42-47, Extra Long: 48+
-        df['pattern_category'] = pd.cut(
-            df['pattern_length'],
-            bins=[0, 36, 41, 47, 100],
-            labels=['Short', 'Medium', 'Long', 'Extra Long']
-        )
+        _standardize_patterns(df)
         
         # Report changes
         new_patterns = df['pattern_name'].nunique()
@@ -171,23 +382,7 @@ def clean_pba_data(input_file, output_file=None):
     # 4. Add a flag for tournament type (PTQ vs. main tournament)
     print("Adding tournament classification...")
     if 'tournament_name' in df.columns:
-        # Identify PTQ events vs main tournaments
-        df['is_ptq'] = df['tournament_name'].str.lower().str.contains('ptq|qualifier|qualifying', na=False)
-        
-        # Add a field for tournament tier
-        conditions = [
-            # Major tournaments
-            df['tournament_name'].str.lower().str.contains('major|masters|us open|pba world|tournament of champions|players championship', na=False),
-            # Standard tournaments
-            ~df['is_ptq'] & ~df['tournament_name'].str.lower().str.contains('regional|challenge|trial', na=False),
-            # PTQ/Qualifiers
-            df['is_ptq'],
-            # Regionals/Challenges
-            df['tournament_name'].str.lower().str.contains('regional|challenge', na=False)
-        ]
-        
-        choices = ['Major', 'Standard', 'Qualifier', 'Regional']
-        df['tournament_tier'] = np.select(conditions, choices, default='Other')
+        _classify_tournaments(df)
         
         # Print distribution
         tier_counts = df['tournament_tier'].value_counts()
@@ -197,44 +392,114 @@ def clean_pba_data(input_file, output_file=None):
     
     # 5. Final cleanup - convert data types, handle missing values
     print("Final data cleanup...")
+    _final_cleanup(df)
     
-    # Convert position to numeric (handling 'T' prefix for ties)
-    if 'position' in df.columns:
-        df['position'] = df['position'].astype(str).str.replace('T', '', regex=False)
-        df['position'] = pd.to_numeric(df['position'], errors='coerce')
+    return df
+
+def clean_pba_data(input_file, output_file=None, chunk_rows=None):
+    """
+    Comprehensive data cleaning for PBA tournament data
     
-    # Convert earnings to numeric
-    if 'earnings' in df.columns:
-        df['earnings'] = df['earnings'].astype(str).str.replace('$', '', regex=False).str.replace(',', '', regex=False)
-        df['earnings'] = pd.to_numeric(df['earnings'], errors='coerce')
+    Args:
+        input_file: Path to the input CSV file
+        output_file: Path to the output CSV file (if None, will use input_file)
+        chunk_rows: If set, stream the file in chunks of this many rows instead of
+            loading it whole, for datasets that don't fit comfortably in memory
     
-    # Convert dates to datetime
-    for date_col in ['start_date', 'end_date']:
-        if date_col in df.columns:
-            df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
+    Returns:
+        Cleaned DataFrame (None when cleaning in chunks)
+    """
+    print(f"Cleaning data from {input_file}...")
     
-    # Handle missing values
-    numeric_cols = df.select_dtypes(include=['number']).columns
-    for col in numeric_cols:
-        if col != 'position':  # Don't fill position
-            df[col] = df[col].fillna(0)
+    if not os.path.exists(input_file):
+        print(f"Error: File {input_file} not found!")
+        return None
     
-    # Save cleaned data
     if output_file is None:
         output_file = input_file
-        
+    
+    if chunk_rows is not None:
+        tier_counts = _clean_pba_data_chunked(input_file, output_file, chunk_rows)
+        print("Tournament tiers distribution:")
+        for tier, count in tier_counts.items():
+            print(f"  {tier}: {count} entries")
+        print(f"Saved cleaned data to {output_file}")
+        return None
+    
+    # Load the data
+    df = pd.read_csv(input_file)
+    print(f"Loaded {len(df)} rows")
+    
+    df = _clean_pba_frame(df)
+    
+    # Save cleaned data
     df.to_csv(output_file, index=False)
     print(f"Saved cleaned data to {output_file}")
     
     return df
 
+def load_and_clean(directory="data", output_file="data/combined_pba_data_cleaned.csv"):
+    """
+    Combine the yearly results files and clean them in one pass, without
+    writing and re-parsing the intermediate combined CSV
+    Dates, positions and earnings are typed once while the CSVs are parsed.
+    
+    Returns:
+        Cleaned DataFrame
+    """
+    from combine_data import combine_csv_files
+    
+    combined_df = combine_csv_files(directory, os.path.join(directory, "combined_pba_data.csv"), emit_csv=False)
+    if combined_df is None:
+        return None
+    
+    df = _clean_pba_frame(combined_df)
+    df.to_csv(output_file, index=False)
+    print(f"Saved cleaned data to {output_file}")
+    
+    return df
+
+def check_chunked_cleaning(input_file, chunk_rows):
+    """
+    Clean a file both whole and in chunks of chunk_rows rows and report whether
+    the two outputs are identical. Small chunk sizes exercise chunks where a
+    column is entirely missing.
+    
+    Returns:
+        True if the outputs match
+    """
+    import filecmp
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        whole_file = os.path.join(tmp_dir, "whole.csv")
+        chunked_file = os.path.join(tmp_dir, "chunked.csv")
+        clean_pba_data(input_file, whole_file)
+        clean_pba_data(input_file, chunked_file, chunk_rows)
+        matches = filecmp.cmp(whole_file, chunked_file, shallow=False)
+    
+    print(f"Chunked output ({chunk_rows} rows per chunk) {'matches' if matches else 'DIFFERS from'} the whole-file output")
+    return matches
+
 # For testing
 if __name__ == "__main__":
-    import numpy as np
     import sys
     
+    # --check compares chunked cleaning against whole-file cleaning instead of
+    # writing output, e.g. python data-cleaning-utility.py data/combined_pba_data.csv - 50 --check
+    check = '--check' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != '--check']
+    
     # Use command line argument or default
-    input_file = sys.argv[1] if len(sys.argv) > 1 else "data/combined_pba_data.csv"
-    output_file = sys.argv[2] if len(sys.argv) > 2 else "data/combined_pba_data_cleaned.csv"
+    input_file = args[0] if len(args) > 0 else "data/combined_pba_data.csv"
+    output_file = args[1] if len(args) > 1 else "data/combined_pba_data_cleaned.csv"
+    chunk_rows = int(args[2]) if len(args) > 2 else None
+    
+    if check:
+        sys.exit(0 if check_chunked_cleaning(input_file, chunk_rows or 50) else 1)
     
-    clean_pba_data(input_file, output_file)
+    # A directory of yearly results files is combined and cleaned in memory
+    if os.path.isdir(input_file):
+        load_and_clean(input_file, output_file)
+    else:
+        clean_pba_data(input_file, output_file, chunk_rows)
@@ -1,14 +1,95 @@
 import os
-import json
+import gzip
+import hashlib
+import logging
+import queue
+import atexit
+import threading
+import time
+import uuid
 import pandas as pd
+import numpy as np
+from pandas.api.types import union_categoricals
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from pattern_analyzer import PBAAnalyzer as PatternAnalyzer
 from venue_pattern_predictor import VenuePatternPredictor
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Responses fall back to Flask's stdlib json provider
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes with orjson, which formats the large lists of
+    numeric dicts returned by the API much faster than the stdlib json module
+    Request parsing is left to the default provider
+    """
+    def _dumps_bytes(self, obj):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option)
+    
+    def dumps(self, obj, **kwargs):
+        return self._dumps_bytes(obj).decode()
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response instead of decoding to str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dumps_bytes(obj), mimetype=self.mimetype)
+
+# Request-level diagnostics go through this logger at DEBUG level, so they cost
+# nothing unless enabled, e.g. PBA_LOG_LEVEL=DEBUG python data_pipeline.py
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=os.environ.get('PBA_LOG_LEVEL', 'INFO').upper())
+
+class QueuedLogHandler(QueueHandler):
+    """
+    Hands log records to a queue that a listener thread writes out through the
+    root handlers, so request threads that log an error never wait on the stream
+    The listener is started by the first record logged in each process, so WSGI
+    workers forked after import (gunicorn --preload) start one of their own
+    """
+    def __init__(self):
+        super().__init__(None)
+        self._listener = None
+        self._listener_pid = None
+        # Flush what is still queued on exit
+        atexit.register(self._stop_listener)
+    
+    def emit(self, record):
+        # Handler.handle() holds the handler lock here, so one listener starts per process
+        if self._listener_pid != os.getpid():
+            # A forked child starts on an empty queue; records still queued at
+            # the fork are the parent's to write
+            self.queue = queue.SimpleQueue()
+            self._listener = QueueListener(self.queue, *logging.getLogger().handlers, respect_handler_level=True)
+            self._listener.start()
+            self._listener_pid = os.getpid()
+        super().emit(record)
+    
+    def _stop_listener(self):
+        if self._listener is not None and self._listener_pid == os.getpid():
+            self._listener.stop()
+
+logger.addHandler(QueuedLogHandler())
+# The listener writes through the root handlers, so don't pass records to them twice
+logger.propagate = False
+
 # Initialize Flask app
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+# Keep keys in insertion order and skip the indentation the stdlib provider adds
+# in debug mode; sorting and pretty-printing only add work to every response
+app.json.sort_keys = False
+app.json.compact = True
 CORS(app)  # Enable CORS for all routes
 
 # Configuration
@@ -28,13 +109,157 @@ MODELS_DIR = os.path.join(DATA_DIR, "models")
 os.makedirs(RESULTS_DIR, exist_ok=True)
 os.makedirs(MODELS_DIR, exist_ok=True)
 
-# Global variables to store analyzers and predictors
-analyzers = {}
-predictors = {}
+def _new_models(analyzers, predictors):
+    """
+    One loaded set of analyzers and predictors keyed by dataset, with empty caches
+    for the lists and responses derived from them
+    """
+    return {
+        'analyzers': analyzers,
+        'predictors': predictors,
+        # Lists served by /api/bowlers, /api/centers and /api/patterns, keyed by
+        # dataset, along with their serialized JSON bodies and gzipped copies. The
+        # analyzer data does not change after loading, so each list is built,
+        # encoded and compressed once.
+        'bowlers': {},
+        'centers': {},
+        'patterns': {},
+        # Serialized /api/bowlers/<id>/performance bodies and their gzipped copies
+        # keyed by (dataset, bowler id), so repeat requests skip the analysis, the
+        # JSON encoding and the compression
+        'performance': {}
+    }
+
+# The loaded models and their caches, published as one object. A reload builds a
+# new one on the side and swaps it in with a single assignment; each request reads
+# _MODELS['active'] once, so it works from one set of models and caches throughout.
+_MODELS = {'active': _new_models({}, {})}
+# Serializes the swaps, so a cache invalidation can't undo a reload that finished meanwhile
+_models_lock = threading.Lock()
+
+# Raw DataFrames by CSV path during initialize_models(), so the analyzer and
+# predictor of a dataset share one parse
+_df_cache = {}
+
+# Low-cardinality text columns parsed as categoricals: each distinct string is
+# stored once, and comparisons and groupbys work on the integer codes
+CATEGORY_COLUMNS = ['name', 'center_name', 'pattern_name', 'pattern_category', 'tournament_name', 'center_location']
+
+# Columns the analyzers, predictors and routes actually read; the rest of the
+# scraped fields (end_date, hometown, points, squad, score, ...) are never loaded
+USECOLS = CATEGORY_COLUMNS + [
+    'start_date', 'tournament_tier', 'pattern_length',
+    'position', 'earnings', 'average', 'match_play_record'
+]
+
+# Narrower types where they hold the values exactly. position, earnings and
+# average stay float64 since the per-bowler stats are aggregated from them, and
+# pattern_length since float32 would serve a length like 42.3 as 42.29999923706055.
+DTYPES = {
+    **{col: 'category' for col in CATEGORY_COLUMNS},
+    'tournament_tier': 'category',
+    'pattern_length': 'float64'
+}
+
+# CSVs larger than this are parsed CSV_CHUNK_ROWS rows at a time, so the
+# parser's intermediate string buffers never cover the whole file at once
+CHUNKED_READ_BYTES = 256 << 20
+CSV_CHUNK_ROWS = 500_000
+
+def _concat_chunks(chunks):
+    """
+    Concatenate parsed chunks column by column
+    Categorical columns are merged with union_categoricals, since pd.concat would
+    turn chunks with different categories into object columns
+    """
+    columns = {}
+    for col in chunks[0].columns:
+        parts = [chunk[col] for chunk in chunks]
+        if isinstance(parts[0].dtype, pd.CategoricalDtype):
+            columns[col] = pd.Series(union_categoricals(parts, sort_categories=True))
+        else:
+            columns[col] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(columns)
+
+def _load_df(path):
+    """Read a results CSV once per load, memory-mapping the file"""
+    if path not in _df_cache:
+        # Columns a file doesn't have are ignored; start_date is parsed here so
+        # the analyzer and predictor find it already converted
+        read_args = dict(
+            usecols=lambda col: col in USECOLS,
+            dtype=DTYPES,
+            parse_dates=['start_date'],
+            memory_map=True
+        )
+        if os.path.getsize(path) > CHUNKED_READ_BYTES:
+            with pd.read_csv(path, chunksize=CSV_CHUNK_ROWS, **read_args) as reader:
+                _df_cache[path] = _concat_chunks(list(reader))
+        else:
+            _df_cache[path] = pd.read_csv(path, low_memory=False, **read_args)
+    return _df_cache[path]
+
+# Upper bound on datasets loaded and trained at once
+MAX_INIT_WORKERS = 8
+
+def _is_loadable_csv(path):
+    """
+    Cheap check that a CSV exists and starts with a header row, so files that
+    can't be loaded are skipped before they are handed to the parsers
+    """
+    try:
+        with open(path, 'rb') as f:
+            return bool(f.readline().strip())
+    except OSError:
+        return False
+
+def _init_dataset(csv_file):
+    """
+    Load and train the analyzer and predictor for one CSV in DATA_DIR
+    Returns (dataset name, analyzer, predictor), or None if the file can't be used
+    """
+    file_path = os.path.join(DATA_DIR, csv_file)
+    
+    file_size = os.path.getsize(file_path) / (1024 * 1024)  # Size in MB
+    print(f"File {file_path} size: {file_size:.2f} MB")
+    
+    file_name = os.path.splitext(csv_file)[0]
+    
+    try:
+        print(f"Initializing analyzer for {file_name}...")
+        analyzer = PatternAnalyzer(file_path, df=_load_df(file_path))
+        
+        print(f"Initializing predictor for {file_name}...")
+        predictor = VenuePatternPredictor(file_path, df=_load_df(file_path))
+        # Train the model
+        predictor.train_model()
+    except Exception as e:
+        print(f"Error initializing models for {file_name}: {str(e)}")
+        return None
+    
+    return file_name, analyzer, predictor
 
 # Initialize analyzers and predictors
 def initialize_models():
-    """Initialize models from available data"""
+    """
+    Initialize models from available data
+    The new analyzers and predictors are built on the side and published with
+    empty caches once they are all ready, so requests keep using the current
+    ones during a reload
+    """
+    new_analyzers = {}
+    new_predictors = {}
+    if not _build_models(new_analyzers, new_predictors):
+        return False
+    with _models_lock:
+        _MODELS['active'] = _new_models(new_analyzers, new_predictors)
+    return True
+
+def _build_models(new_analyzers, new_predictors):
+    """
+    Load every dataset into the given analyzer and predictor dicts
+    Returns whether at least one dataset was loaded
+    """
     try:
         # Check if the data directory exists
         if not os.path.exists(DATA_DIR):
@@ -50,17 +275,15 @@ def initialize_models():
             file_size = os.path.getsize(combined_file) / (1024 * 1024)  # Size in MB
             print(f"File size: {file_size:.2f} MB")
             
-            analyzers['pba_results'] = PatternAnalyzer(combined_file)
-            predictors['pba_results'] = VenuePatternPredictor(combined_file)
-            predictors['pba_results'].train_model()
+            new_analyzers['pba_results'] = PatternAnalyzer(combined_file, df=_load_df(combined_file))
+            new_predictors['pba_results'] = VenuePatternPredictor(combined_file, df=_load_df(combined_file))
+            new_predictors['pba_results'].train_model()
             return True
             
-        # Look for any PBA results CSV files
-        csv_files = [f for f in os.listdir(DATA_DIR) if f.endswith('.csv') and 'pba_results' in f]
-        
-        if not csv_files:
-            # Look for any CSV files
-            csv_files = [f for f in os.listdir(DATA_DIR) if f.endswith('.csv')]
+        # Look for any PBA results CSV files, or else any CSV files, from one directory listing
+        with os.scandir(DATA_DIR) as entries:
+            all_csv_files = [entry.name for entry in entries if entry.name.endswith('.csv') and entry.is_file()]
+        csv_files = [f for f in all_csv_files if 'pba_results' in f] or all_csv_files
         
         if not csv_files:
             print(f"No CSV files found in {DATA_DIR}!")
@@ -68,52 +291,51 @@ def initialize_models():
             
         print(f"Found {len(csv_files)} CSV files: {csv_files}")
         
-        for csv_file in csv_files:
-            file_path = os.path.join(DATA_DIR, csv_file)
-            
-            # Make sure the file exists and has content
-            if not os.path.exists(file_path):
-                print(f"Error: File {file_path} does not exist!")
-                continue
-                
-            file_size = os.path.getsize(file_path) / (1024 * 1024)  # Size in MB
-            print(f"File {file_path} size: {file_size:.2f} MB")
-            
-            file_name = os.path.splitext(csv_file)[0]
+        # Skip missing or empty files up front; everything that fails is reported once below
+        loadable = [f for f in csv_files if _is_loadable_csv(os.path.join(DATA_DIR, f))]
+        failed = [f for f in csv_files if f not in loadable]
+        
+        if loadable:
+            # Datasets are independent, so load and train them in parallel. The
+            # shared dicts are only written from this thread once the pool is done.
+            with ThreadPoolExecutor(max_workers=min(MAX_INIT_WORKERS, len(loadable))) as executor:
+                loaded = list(executor.map(_init_dataset, loadable))
             
-            try:
-                print(f"Initializing analyzer for {file_name}...")
-                analyzers[file_name] = PatternAnalyzer(file_path)
-                
-                print(f"Initializing predictor for {file_name}...")
-                predictors[file_name] = VenuePatternPredictor(file_path)
-                # Train the model
-                predictors[file_name].train_model()
-            except Exception as e:
-                print(f"Error initializing models for {file_name}: {str(e)}")
-                continue
+            for csv_file, entry in zip(loadable, loaded):
+                if entry is None:
+                    failed.append(csv_file)
+                    continue
+                file_name, analyzer, predictor = entry
+                new_analyzers[file_name] = analyzer
+                new_predictors[file_name] = predictor
+        
+        if failed:
+            print(f"Warning: Skipped {len(failed)} CSV files that could not be loaded: {failed}")
         
         # Ensure we always have a 'pba_results' dataset
-        if 'pba_results' not in analyzers and csv_files:
-            # Use the first available CSV as the default
-            first_csv = csv_files[0]
+        if 'pba_results' not in new_analyzers and len(failed) < len(csv_files):
+            # Use the first CSV that loaded as the default
+            first_csv = next(f for f in csv_files if f not in failed)
             first_path = os.path.join(DATA_DIR, first_csv)
             
             print(f"Setting {first_csv} as the default 'pba_results' dataset")
             try:
-                analyzers['pba_results'] = PatternAnalyzer(first_path)
-                predictors['pba_results'] = VenuePatternPredictor(first_path)
-                predictors['pba_results'].train_model()
+                new_analyzers['pba_results'] = PatternAnalyzer(first_path, df=_load_df(first_path))
+                new_predictors['pba_results'] = VenuePatternPredictor(first_path, df=_load_df(first_path))
+                new_predictors['pba_results'].train_model()
             except Exception as e:
                 print(f"Error setting default dataset: {str(e)}")
                 return False
                 
-        return len(analyzers) > 0
+        return len(new_analyzers) > 0
     except Exception as e:
         print(f"Error initializing models: {str(e)}")
         import traceback
         traceback.print_exc()
         return False
+    finally:
+        # The analyzers and predictors keep their own copies
+        _df_cache.clear()
 
 # Data collection pipeline
 def run_data_collection_pipeline(years=None, save=True):
@@ -151,13 +373,351 @@ def run_data_collection_pipeline(years=None, save=True):
         combined_file = os.path.join(RESULTS_DIR, f"pba_results_{'_'.join(map(str, years))}.json")
         combined_csv = os.path.join(DATA_DIR, f"pba_results_{'_'.join(map(str, years))}.csv")
         
-        with open(combined_file, 'w') as f:
-            json.dump(all_results, f, indent=2)
-            
+        scraper.save_results(all_results, combined_file)
         scraper.save_to_csv(all_results, combined_csv)
     
     return all_results
 
+# Pattern length categories, in the order they are charted
+PATTERN_CATEGORIES = ('Short', 'Medium', 'Long', 'Extra Long')
+
+# Radar entries used when the radar stats can't be calculated
+RADAR_CATEGORIES = ('Short Patterns', 'Medium Patterns', 'Long Patterns', 'Extra Long Patterns',
+                    'Overall Scoring', 'Earnings Potential')
+RADAR_DEFAULT = tuple({'attribute': category, 'value': 50} for category in RADAR_CATEGORIES)
+
+# byPattern and recentTrend entries used when those sections can't be built
+BY_PATTERN_DEFAULT = tuple(
+    {'category': category, 'avgPosition': 0.0, 'tournamentCount': 0, 'avgEarnings': 0.0}
+    for category in PATTERN_CATEGORIES
+)
+RECENT_TREND_DEFAULT = tuple(
+    {'tournamentId': i + 1, 'date': f"2023-{i+1:02d}-01", 'position': 10 - i, 'pattern': "Unknown"}
+    for i in range(5)
+)
+
+def _radar_score(raw):
+    """
+    Clamp a radar score to 0-100 and round it to a whole number
+    The chart rounds anyway; halves round up, like the frontend's Math.round
+    """
+    return int(min(100, max(0, raw)) + 0.5)
+
+def _radar_value(category, avg_by_category):
+    """
+    Radar score for one pattern category: 100 minus the average finishing position,
+    or the middle value 50 if the bowler has no results in that category
+    """
+    avg_position = avg_by_category.get(category)
+    if avg_position is not None and pd.notna(avg_position):
+        return _radar_score(100 - avg_position)
+    return 50
+
+# Placeholder performance data returned when building a response fails,
+# serialized once here instead of on every failure
+DEFAULT_PERFORMANCE_JSON = app.json.dumps({
+    'byPattern': [
+        {'category': 'Short', 'avgPosition': 15.0, 'tournamentCount': 5, 'avgEarnings': 5000.0},
+        {'category': 'Medium', 'avgPosition': 12.0, 'tournamentCount': 8, 'avgEarnings': 7500.0},
+        {'category': 'Long', 'avgPosition': 18.0, 'tournamentCount': 3, 'avgEarnings': 3000.0},
+        {'category': 'Extra Long', 'avgPosition': 20.0, 'tournamentCount': 2, 'avgEarnings': 2000.0}
+    ],
+    'recentTrend': [
+        {'tournamentId': 1, 'date': '2023-01-01', 'position': 15, 'pattern': 'Medium'},
+        {'tournamentId': 2, 'date': '2023-02-01', 'position': 10, 'pattern': 'Short'},
+        {'tournamentId': 3, 'date': '2023-03-01', 'position': 5, 'pattern': 'Medium'},
+        {'tournamentId': 4, 'date': '2023-04-01', 'position': 8, 'pattern': 'Long'},
+        {'tournamentId': 5, 'date': '2023-05-01', 'position': 12, 'pattern': 'Medium'}
+    ],
+    'patternRadar': [
+        {'attribute': 'Short Patterns', 'value': 60},
+        {'attribute': 'Medium Patterns', 'value': 70},
+        {'attribute': 'Long Patterns', 'value': 50},
+        {'attribute': 'Extra Long Patterns', 'value': 40},
+        {'attribute': 'Match Play Win %', 'value': 65},
+        {'attribute': 'Earnings Potential', 'value': 55}
+    ]
+}).encode()
+# Lets clients that poll the placeholder revalidate it with a 304 instead of re-downloading it
+DEFAULT_PERFORMANCE_ETAG = hashlib.md5(DEFAULT_PERFORMANCE_JSON).hexdigest()
+
+def _normalize_whitespace(series):
+    """Distinct non-missing values as strings, trimmed and with inner whitespace collapsed"""
+    values = pd.Series(series.dropna().unique(), dtype=object).astype(str)
+    return values.str.split().str.join(' ')
+
+def _compute_bowlers(analyzer):
+    """Build the bowler list with stats from a dataset's analyzer"""
+    bowler_stats = analyzer.get_bowler_stats()
+    
+    # Debug info
+    print(f"Bowler stats shape: {bowler_stats.shape if not bowler_stats.empty else 'Empty'}")
+    if not bowler_stats.empty:
+        print(f"First bowler columns: {bowler_stats.columns.tolist()}")
+    
+    # Convert to list of bowlers with stats. NaN values (or missing columns) become 0
+    # in one vectorized fill, then the rows are read from a plain NumPy array
+    stat_cols = ['tournaments_played', 'avg_position', 'best_position', 'total_earnings', 'win_percentage']
+    values = bowler_stats.reindex(columns=stat_cols).fillna(0).to_numpy(dtype=float)
+    
+    bowlers = []
+    for name, (tournaments_played, avg_position, best_position, total_earnings, win_percentage) in zip(bowler_stats.index, values):
+        bowlers.append({
+            'id': len(bowlers) + 1,  # Generate an ID
+            'name': name,
+            'tournaments_played': int(tournaments_played),
+            'avg_position': float(avg_position),
+            'best_position': int(best_position),
+            'total_earnings': float(total_earnings),
+            'win_percentage': float(win_percentage)
+        })
+    
+    return bowlers
+
+def _compute_centers(analyzer):
+    """Build the alphabetical center list from a dataset's analyzer"""
+    # Get unique centers from the dataset
+    df = analyzer.df
+    
+    centers = []
+    
+    # PRIORITY 1: Use center_name if available
+    if 'center_name' in df.columns and not df['center_name'].isna().all():
+        print("Using center_name column")
+        
+        names = _normalize_whitespace(df['center_name'])
+        names = names[names.str.len() >= 3].drop_duplicates()
+        centers = [{'name': name} for name in names]
+    
+    # PRIORITY 2: If center_name doesn't yield results, try center_location
+    if not centers and 'center_location' in df.columns and not df['center_location'].isna().all():
+        print("Falling back to center_location column")
+        
+        locations = _normalize_whitespace(df['center_location'])
+        # Extract first part of location (before comma if any)
+        venues = locations[locations.str.len() >= 3].str.split(',').str[0].str.strip()
+        venues = venues[venues != ''].drop_duplicates()
+        centers = [{'name': venue} for venue in venues]
+    
+    # PRIORITY 3: Use tournament names if needed
+    if not centers and 'tournament_name' in df.columns:
+        print("Using tournament names")
+        
+        names = _normalize_whitespace(df['tournament_name'])
+        names = names[names.str.len() >= 3].drop_duplicates()
+        centers = [{'name': f"Event: {name}"} for name in names]
+    
+    # PRIORITY 4: Default fallback values
+    if not centers:
+        print("Using default values")
+        default_centers = [
+            "Thunderbowl Lanes",
+            "South Point Bowling Plaza",
+            "Woodland Bowl",
+            "Bayside Bowl",
+            "The Orleans"
+        ]
+        centers = [{'name': center} for center in default_centers]
+    
+    # Sort alphabetically and add location as empty string
+    centers = sorted(centers, key=lambda x: x['name'])
+    
+    # Add IDs and empty location field
+    for i, center in enumerate(centers):
+        center['id'] = i + 1
+        center['location'] = ''  # Empty string for location
+    
+    return centers
+
+def _compute_patterns(analyzer):
+    """Build the alphabetical pattern list from a dataset's analyzer"""
+    # Get unique patterns from the dataset
+    df = analyzer.df
+    
+    patterns = []
+    if 'pattern_name' in df.columns:
+        # Prepare columns to use (the analyzer adds pattern_category at load
+        # whenever pattern_length is available)
+        pattern_cols = ['pattern_name']
+        if 'pattern_length' in df.columns:
+            pattern_cols.append('pattern_length')
+        if 'pattern_category' in df.columns:
+            pattern_cols.append('pattern_category')
+    
+        # Get unique patterns
+        unique_patterns = df[pattern_cols].dropna(subset=['pattern_name']).drop_duplicates()
+    
+        # Read rows as plain tuples; absent columns are padded with NaN so they
+        # fall back to the same defaults as missing values
+        rows = unique_patterns.reindex(columns=['pattern_name', 'pattern_length', 'pattern_category'])
+        
+        for i, (pattern_name, length, category) in enumerate(rows.itertuples(index=False, name=None)):
+            # Skip rows with missing names
+            if pd.isna(pattern_name) or pattern_name == '':
+                continue
+            
+            patterns.append({
+                'id': i + 1,  # Generate an ID
+                'name': pattern_name,
+                # Add length and category if available
+                'length': float(length) if not pd.isna(length) else 0,
+                'category': category if not pd.isna(category) else 'Unknown'
+            })
+    
+    # Sort patterns alphabetically by name
+    patterns = sorted(patterns, key=lambda p: p['name'])
+    
+    # Reassign IDs after sorting to maintain consistent order
+    for i, pattern in enumerate(patterns):
+        pattern['id'] = i + 1
+    
+    return patterns
+
+def clear_caches():
+    """
+    Drop every list and response derived from the loaded data
+    The current models are republished with empty caches, so a request still
+    working from the previous object only writes into the discarded ones
+    """
+    with _models_lock:
+        active = _MODELS['active']
+        _MODELS['active'] = _new_models(active['analyzers'], active['predictors'])
+
+def _cached_list(models, kind, dataset, compute):
+    """
+    Compute a dataset's list once, cached in the models' `kind` cache along with
+    an {id: item} index and the JSON body the list endpoint returns, plain and gzipped
+    """
+    cache = models[kind]
+    if dataset not in cache:
+        items = compute(models['analyzers'][dataset])
+        # Keys are strings to match the ids passed in request arguments
+        index = {str(item['id']): item for item in items}
+        body = app.json.response(items).get_data()
+        cache[dataset] = (items, index, (body, _gzip_body(body)))
+    return cache[dataset]
+
+def get_bowler_list(models, dataset):
+    """Cached bowler list for a dataset of the given models"""
+    return _cached_list(models, 'bowlers', dataset, _compute_bowlers)[0]
+
+def get_bowler_index(models, dataset):
+    """Cached bowler lookup by id for a dataset of the given models"""
+    return _cached_list(models, 'bowlers', dataset, _compute_bowlers)[1]
+
+def get_bowler_json(models, dataset):
+    """Cached JSON body of the bowler list for a dataset of the given models, with its gzipped copy"""
+    return _cached_list(models, 'bowlers', dataset, _compute_bowlers)[2]
+
+def get_center_list(models, dataset):
+    """Cached center list for a dataset of the given models"""
+    return _cached_list(models, 'centers', dataset, _compute_centers)[0]
+
+def get_center_index(models, dataset):
+    """Cached center lookup by id for a dataset of the given models"""
+    return _cached_list(models, 'centers', dataset, _compute_centers)[1]
+
+def get_center_json(models, dataset):
+    """Cached JSON body of the center list for a dataset of the given models, with its gzipped copy"""
+    return _cached_list(models, 'centers', dataset, _compute_centers)[2]
+
+def get_pattern_list(models, dataset):
+    """Cached pattern list for a dataset of the given models"""
+    return _cached_list(models, 'patterns', dataset, _compute_patterns)[0]
+
+def get_pattern_index(models, dataset):
+    """Cached pattern lookup by id for a dataset of the given models"""
+    return _cached_list(models, 'patterns', dataset, _compute_patterns)[1]
+
+def get_pattern_json(models, dataset):
+    """Cached JSON body of the pattern list for a dataset of the given models, with its gzipped copy"""
+    return _cached_list(models, 'patterns', dataset, _compute_patterns)[2]
+
+# Set once the first model load has finished, whether or not it found data
+_ready = threading.Event()
+# Keeps the startup load and reloads from /api/data/collect from overlapping
+_init_lock = threading.Lock()
+
+# Data collection runs, and the reloads that follow them, one at a time off the
+# request thread
+_reload_executor = ThreadPoolExecutor(max_workers=1)
+
+def _warm_caches(models):
+    """
+    Build every dataset's bowler, center and pattern lists and their JSON bodies
+    up front, so the first requests after a load are served from memory
+    """
+    for dataset in models['analyzers']:
+        try:
+            get_bowler_list(models, dataset)
+            get_center_list(models, dataset)
+            get_pattern_list(models, dataset)
+        except Exception as e:
+            # The lists are built on first request instead
+            print(f"Error precomputing lists for {dataset}: {str(e)}")
+
+def _load_models():
+    """
+    Run initialize_models() under the lock and mark the API ready
+    Returns whether the models were loaded
+    """
+    with _init_lock:
+        try:
+            if initialize_models():
+                _warm_caches(_MODELS['active'])
+                print("Models initialized successfully!")
+                return True
+            print("Warning: Failed to initialize models. API routes may not work correctly.")
+            return False
+        finally:
+            _ready.set()
+
+# JSON responses at least this many bytes are gzipped for clients that accept it.
+# Level 4 compresses the repeated field names well at a fraction of level 9's cost.
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 4
+
+def _gzip_body(body):
+    """Gzipped copy of a JSON body to cache with it, or None if it is too small to compress"""
+    if len(body) < GZIP_MIN_SIZE:
+        return None
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+def _cached_json_response(body, gzipped):
+    """
+    Response for a cached JSON body, sent as its cached gzipped copy when the client
+    accepts gzip, so repeat requests don't compress the same bytes again
+    """
+    if gzipped is None or 'gzip' not in request.accept_encodings:
+        return app.response_class(body, mimetype='application/json')
+    
+    response = app.response_class(gzipped, mimetype='application/json')
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
+@app.after_request
+def gzip_response(response):
+    """
+    Gzip large JSON responses when the client accepts gzip
+    Responses from the caches arrive already compressed and are passed through
+    """
+    if (response.mimetype != 'application/json'
+            or response.direct_passthrough
+            or not 200 <= response.status_code < 300
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.accept_encodings):
+        return response
+    
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(data, compresslevel=GZIP_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
 # API Routes
 
 @app.route('/api/bowlers', methods=['GET'])
@@ -165,9 +725,11 @@ def get_bowlers():
     """Get list of bowlers from the dataset"""
     try:
         dataset = request.args.get('dataset', 'pba_results')
+        models = _MODELS['active']
+        analyzers = models['analyzers']
         
-        if len(analyzers) == 0:
-            initialize_models()
+        if not _ready.is_set():
+            return jsonify({'status': 'loading'}), 503
             
         if len(analyzers) == 0:
             return jsonify({'error': 'No data loaded. Please check the server logs.'}), 500
@@ -176,48 +738,13 @@ def get_bowlers():
             # If the requested dataset doesn't exist, use the first available
             if analyzers:
                 dataset = list(analyzers.keys())[0]
-                print(f"Requested dataset '{dataset}' not found, using '{dataset}' instead")
+                logger.warning("Requested dataset '%s' not found, using '%s' instead", dataset, dataset)
             else:
                 return jsonify({'error': 'No datasets available. Please check the server logs.'}), 500
             
-        analyzer = analyzers[dataset]
-        bowler_stats = analyzer.get_bowler_stats()
-        
-        # Debug info
-        print(f"Bowler stats shape: {bowler_stats.shape if not bowler_stats.empty else 'Empty'}")
-        if not bowler_stats.empty:
-            print(f"First bowler columns: {bowler_stats.columns.tolist()}")
-        
-        # Convert to list of bowlers with stats, handling NaN values safely
-        bowlers = []
-        for name, stats in bowler_stats.iterrows():
-            # Handle NaN values safely with conversion
-            try:
-                tournaments_played = int(stats.get('tournaments_played', 0)) if not pd.isna(stats.get('tournaments_played', 0)) else 0
-                avg_position = float(stats.get('avg_position', 0)) if not pd.isna(stats.get('avg_position', 0)) else 0.0
-                best_position = int(stats.get('best_position', 0)) if not pd.isna(stats.get('best_position', 0)) else 0
-                total_earnings = float(stats.get('total_earnings', 0)) if not pd.isna(stats.get('total_earnings', 0)) else 0.0
-                win_percentage = float(stats.get('win_percentage', 0)) if not pd.isna(stats.get('win_percentage', 0)) else 0.0
-                
-                bowlers.append({
-                    'id': len(bowlers) + 1,  # Generate an ID
-                    'name': name,
-                    'tournaments_played': tournaments_played,
-                    'avg_position': avg_position,
-                    'best_position': best_position,
-                    'total_earnings': total_earnings,
-                    'win_percentage': win_percentage
-                })
-            except Exception as e:
-                print(f"Error processing bowler {name}: {str(e)}")
-                # Continue to next bowler instead of failing the entire request
-                continue
-            
-        return jsonify(bowlers)
+        return _cached_json_response(*get_bowler_json(models, dataset))
     except Exception as e:
-        print(f"Error in get_bowlers: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in get_bowlers: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/centers', methods=['GET'])
@@ -225,9 +752,11 @@ def get_centers():
     """Get list of centers from the dataset - just the names, alphabetically sorted"""
     try:
         dataset = request.args.get('dataset', 'pba_results')
+        models = _MODELS['active']
+        analyzers = models['analyzers']
         
-        if len(analyzers) == 0:
-            initialize_models()
+        if not _ready.is_set():
+            return jsonify({'status': 'loading'}), 503
             
         if len(analyzers) == 0:
             return jsonify({'error': 'No data loaded. Please check the server logs.'}), 500
@@ -236,84 +765,13 @@ def get_centers():
             # If the requested dataset doesn't exist, use the first available
             if analyzers:
                 dataset = list(analyzers.keys())[0]
-                print(f"Requested dataset '{dataset}' not found, using '{dataset}' instead")
+                logger.warning("Requested dataset '%s' not found, using '%s' instead", dataset, dataset)
             else:
                 return jsonify({'error': 'No datasets available. Please check the server logs.'}), 500
             
-        # Get unique centers from the dataset
-        df = analyzers[dataset].df
-        
-        centers = []
-        unique_names = set()
-        
-        # Clean and normalize function for center names
-        def clean_text(text):
-            if pd.isna(text) or text == '':
-                return ''
-            text = str(text).strip()
-            return ' '.join(text.split())  # Normalize spaces
-        
-        # PRIORITY 1: Use center_name if available
-        if 'center_name' in df.columns and not df['center_name'].isna().all():
-            print("Using center_name column")
-            
-            for center_name in df['center_name'].dropna().unique():
-                cleaned_name = clean_text(center_name)
-                if cleaned_name and len(cleaned_name) >= 3 and cleaned_name not in unique_names:
-                    unique_names.add(cleaned_name)
-                    centers.append({'name': cleaned_name})
-        
-        # PRIORITY 2: If center_name doesn't yield results, try center_location
-        if not centers and 'center_location' in df.columns and not df['center_location'].isna().all():
-            print("Falling back to center_location column")
-            
-            for location in df['center_location'].dropna().unique():
-                cleaned_loc = clean_text(location)
-                if cleaned_loc and len(cleaned_loc) >= 3:
-                    # Extract first part of location (before comma if any)
-                    venue_name = cleaned_loc.split(',')[0].strip()
-                    if venue_name and venue_name not in unique_names:
-                        unique_names.add(venue_name)
-                        centers.append({'name': venue_name})
-        
-        # PRIORITY 3: Use tournament names if needed
-        if not centers and 'tournament_name' in df.columns:
-            print("Using tournament names")
-            
-            for tournament in df['tournament_name'].dropna().unique():
-                cleaned_name = clean_text(tournament)
-                if cleaned_name and len(cleaned_name) >= 3 and cleaned_name not in unique_names:
-                    unique_names.add(cleaned_name)
-                    centers.append({'name': f"Event: {cleaned_name}"})
-        
-        # PRIORITY 4: Default fallback values
-        if not centers:
-            print("Using default values")
-            default_centers = [
-                "Thunderbowl Lanes",
-                "South Point Bowling Plaza",
-                "Woodland Bowl",
-                "Bayside Bowl",
-                "The Orleans"
-            ]
-            
-            for center in default_centers:
-                if center not in unique_names:
-                    centers.append({'name': center})
-        
-        # Sort alphabetically and add location as empty string
-        centers = sorted(centers, key=lambda x: x['name'])
-        
-        # Add IDs and empty location field
-        for i, center in enumerate(centers):
-            center['id'] = i + 1
-            center['location'] = ''  # Empty string for location
-        
-        return jsonify(centers)
+        return _cached_json_response(*get_center_json(models, dataset))
     except Exception as e:
-        print(f"Error in get_centers: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in get_centers: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/patterns', methods=['GET'])
@@ -321,9 +779,11 @@ def get_patterns():
     """Get list of patterns from the dataset"""
     try:
         dataset = request.args.get('dataset', 'pba_results')
+        models = _MODELS['active']
+        analyzers = models['analyzers']
         
-        if len(analyzers) == 0:
-            initialize_models()
+        if not _ready.is_set():
+            return jsonify({'status': 'loading'}), 503
             
         if len(analyzers) == 0:
             return jsonify({'error': 'No data loaded. Please check the server logs.'}), 500
@@ -332,79 +792,13 @@ def get_patterns():
             # If the requested dataset doesn't exist, use the first available
             if analyzers:
                 dataset = list(analyzers.keys())[0]
-                print(f"Requested dataset '{dataset}' not found, using '{dataset}' instead")
+                logger.warning("Requested dataset '%s' not found, using '%s' instead", dataset, dataset)
             else:
                 return jsonify({'error': 'No datasets available. Please check the server logs.'}), 500
             
-        # Get unique patterns from the dataset
-        df = analyzers[dataset].df
-        
-        patterns = []
-        if 'pattern_name' in df.columns:
-            # Use pattern_category if available, otherwise use length to categorize
-            if 'pattern_category' not in df.columns and 'pattern_length' in df.columns:
-                df['pattern_category'] = pd.cut(
-                    df['pattern_length'],
-                    bins=[0, 36, 41, 47, 100],
-                    labels=['Short', 'Medium', 'Long', 'Extra Long']
-                )
-                
-            # Prepare columns to use
-            pattern_cols = ['pattern_name']
-            if 'pattern_length' in df.columns:
-                pattern_cols.append('pattern_length')
-            if 'pattern_category' in df.columns:
-                pattern_cols.append('pattern_category')
-                
-            # Get unique patterns
-            unique_patterns = df[pattern_cols].dropna(subset=['pattern_name']).drop_duplicates()
-            
-            for i, (_, row) in enumerate(unique_patterns.iterrows()):
-                pattern_name = row.get('pattern_name', 'Unknown Pattern')
-                
-                # Skip rows with missing names
-                if pd.isna(pattern_name) or pattern_name == '':
-                    continue
-                    
-                pattern = {
-                    'id': i + 1,  # Generate an ID
-                    'name': pattern_name
-                }
-                
-                # Add length if available
-                if 'pattern_length' in pattern_cols:
-                    length = row.get('pattern_length')
-                    if not pd.isna(length):
-                        pattern['length'] = float(length)
-                    else:
-                        pattern['length'] = 0
-                else:
-                    pattern['length'] = 0
-                    
-                # Add category if available
-                if 'pattern_category' in pattern_cols:
-                    category = row.get('pattern_category')
-                    if not pd.isna(category):
-                        pattern['category'] = category
-                    else:
-                        pattern['category'] = 'Unknown'
-                else:
-                    pattern['category'] = 'Unknown'
-                    
-                patterns.append(pattern)
-        
-        # Sort patterns alphabetically by name
-        patterns = sorted(patterns, key=lambda p: p['name'])
-        
-        # Reassign IDs after sorting to maintain consistent order
-        for i, pattern in enumerate(patterns):
-            pattern['id'] = i + 1
-        
-        return jsonify(patterns)
+        return _cached_json_response(*get_pattern_json(models, dataset))
     except Exception as e:
-        print(f"Error in get_patterns: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in get_patterns: %s", e)
         return jsonify({'error': str(e)}), 500
 
 # Updates to data_pipeline.py - Fix prediction sorting and restore original limits
@@ -417,12 +811,15 @@ def get_predictions():
         center_id = request.args.get('center')
         pattern_id = request.args.get('pattern')
         pattern_length = request.args.get('patternLength')
+        models = _MODELS['active']
+        analyzers = models['analyzers']
+        predictors = models['predictors']
         
         # Debug information
-        print(f"Prediction request - center_id: {center_id}, pattern_id: {pattern_id}, pattern_length: {pattern_length}")
+        logger.debug("Prediction request - center_id: %s, pattern_id: %s, pattern_length: %s", center_id, pattern_id, pattern_length)
         
-        if len(predictors) == 0:
-            initialize_models()
+        if not _ready.is_set():
+            return jsonify({'status': 'loading'}), 503
             
         if len(predictors) == 0:
             return jsonify({'error': 'No data loaded. Please check the server logs.'}), 500
@@ -431,31 +828,30 @@ def get_predictions():
             # If the requested dataset doesn't exist, use the first available
             if predictors:
                 dataset = list(predictors.keys())[0]
-                print(f"Requested dataset '{dataset}' not found, using '{dataset}' instead")
+                logger.warning("Requested dataset '%s' not found, using '%s' instead", dataset, dataset)
             else:
                 return jsonify({'error': 'No datasets available. Please check the server logs.'}), 500
             
         # Get center and pattern details if provided
-        centers = json.loads(get_centers().data)
-        patterns = json.loads(get_patterns().data)
+        patterns = get_pattern_list(models, dataset)
         
         center = None
         pattern = None
         
         # Check if we have a valid center_id (not 0 and not empty)
         if center_id and center_id != '0' and center_id.strip() != '':
-            center = next((c for c in centers if str(c['id']) == center_id), None)
-            print(f"Selected center: {center['name'] if center else 'None'}")
+            center = get_center_index(models, dataset).get(center_id)
+            logger.debug("Selected center: %s", center['name'] if center else 'None')
             
         # Check if we have a valid pattern_id (not 0 and not empty)
         if pattern_id and pattern_id != '0' and pattern_id.strip() != '':
-            pattern = next((p for p in patterns if str(p['id']) == pattern_id), None)
-            print(f"Selected pattern: {pattern['name'] if pattern else 'None'}")
+            pattern = get_pattern_index(models, dataset).get(pattern_id)
+            logger.debug("Selected pattern: %s", pattern['name'] if pattern else 'None')
         # Check if we have a pattern length specified
         elif pattern_length and pattern_length.strip() != '':
             try:
                 length = float(pattern_length)
-                print(f"Using pattern length: {length}ft")
+                logger.debug("Using pattern length: %sft", length)
                 # Find a pattern with matching length or similar category
                 pattern = next((p for p in patterns if abs(p['length'] - length) < 0.5), None)
                 if not pattern:
@@ -474,9 +870,9 @@ def get_predictions():
                     pattern = dict(pattern)  # Create a copy to avoid modifying the original
                     pattern['name'] = f"{length}ft Pattern"
                     pattern['length'] = length
-                    print(f"Using pattern based on length: {pattern['name']}")
+                    logger.debug("Using pattern based on length: %s", pattern['name'])
             except (ValueError, TypeError):
-                print(f"Invalid pattern length: {pattern_length}")
+                logger.debug("Invalid pattern length: %s", pattern_length)
             
         # Need at least one valid selection
         if not center and not pattern:
@@ -490,9 +886,12 @@ def get_predictions():
         pattern_name = pattern['name'] if pattern else None
         pattern_length_value = pattern['length'] if pattern else None
         
-        print(f"Ranking bowlers for center: {center_name if center_name else 'Any'}")
-        print(f"Pattern name: {pattern_name if pattern_name else 'Any'}")
-        print(f"Pattern length: {pattern_length_value}ft" if pattern_length_value else "No pattern length specified")
+        logger.debug("Ranking bowlers for center: %s", center_name if center_name else 'Any')
+        logger.debug("Pattern name: %s", pattern_name if pattern_name else 'Any')
+        if pattern_length_value:
+            logger.debug("Pattern length: %sft", pattern_length_value)
+        else:
+            logger.debug("No pattern length specified")
         
         # Get multi-factor prediction - restore the original top_n parameter
         predictions_df = analyzer.get_multi_factor_prediction(
@@ -514,37 +913,45 @@ def get_predictions():
         # This is the key part: total_score is the Performance Score (0-100)
         ranked_df = predictions_df.sort_values(by='total_score', ascending=False).reset_index(drop=True)
 
-        # Create a dictionary mapping bowler names to their rank
-        rank_mapping = {row['name']: i+1 for i, (_, row) in enumerate(ranked_df.iterrows())}
+        # Create a mapping of bowler names to their rank
+        rank_mapping = pd.Series(np.arange(1, len(ranked_df) + 1), index=ranked_df['name'].to_numpy())
         
         # Keep original order for display purposes (sorting can be done on the frontend)
-        result = []
-        for i, row in predictions_df.iterrows():
-            bowler_name = row['name']
-            # Get true average position from bowler_stats
-            true_avg_position = 0
-            if bowler_name in bowler_stats.index:
-                true_avg_position = float(bowler_stats.loc[bowler_name, 'avg_position'])
-
-            # Use the rank as the predicted position - THIS IS THE KEY FIX
-            predicted_position = rank_mapping.get(bowler_name, i+1)
-
-            # Format the result for the frontend
-            result.append({
-                'bowlerId': i + 1,
-                'bowlerName': row['name'],
-                'predictedPosition': float(predicted_position),  # Use rank based on total_score
-                'patternExperience': int(row['pattern_tournaments']) if pd.notna(row['pattern_tournaments']) else 0,
-                'centerExperience': int(row['center_tournaments']) if pd.notna(row['center_tournaments']) else 0,
-                'avgPosition': float(row['total_score']) if pd.notna(row['total_score']) else 0,  # Performance Score (0-100)
-                'trueAvgPosition': true_avg_position  # Historical average position
-            })
+        # Each response field is prepared as a whole column: missing counts and scores
+        # become 0, and bowlers without overall stats get a historical average of 0.
+        # tolist() converts a column to Python numbers in one call, so the dicts below
+        # need no per-bowler int()/float() casts.
+        names = predictions_df['name'].to_numpy()
+        bowler_ids = (predictions_df.index + 1).to_numpy()
+        # Use the rank based on total_score as the predicted position
+        ranks = rank_mapping.reindex(names).to_numpy(dtype=float)
+        predicted_positions = np.where(np.isnan(ranks), bowler_ids, ranks).tolist()
+        bowler_ids = bowler_ids.tolist()
+        pattern_experience = predictions_df['pattern_tournaments'].fillna(0).to_numpy(dtype=int).tolist()
+        center_experience = predictions_df['center_tournaments'].fillna(0).to_numpy(dtype=int).tolist()
+        scores = predictions_df['total_score'].fillna(0).to_numpy(dtype=float).tolist()
+        # Get true average position from bowler_stats
+        true_avg_positions = bowler_stats['avg_position'].reindex(names).fillna(0).to_numpy(dtype=float).tolist()
+        
+        result = [
+            {
+                'bowlerId': bowler_id,
+                'bowlerName': name,
+                # Use the rank as the predicted position - THIS IS THE KEY FIX
+                'predictedPosition': predicted_position,  # Use rank based on total_score
+                'patternExperience': pattern_exp,
+                'centerExperience': center_exp,
+                'avgPosition': score,  # Performance Score (0-100)
+                'trueAvgPosition': true_avg  # Historical average position
+            }
+            for name, bowler_id, predicted_position, pattern_exp, center_exp, score, true_avg in zip(
+                names, bowler_ids, predicted_positions, pattern_experience, center_experience, scores, true_avg_positions
+            )
+        ]
             
         return jsonify(result)
     except Exception as e:
-        print(f"Error in get_predictions: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in get_predictions: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/bowlers/<bowler_id>/performance', methods=['GET'])
@@ -552,9 +959,11 @@ def get_bowler_performance(bowler_id):
     """Get detailed performance metrics for a bowler"""
     try:
         dataset = request.args.get('dataset', 'pba_results')
+        models = _MODELS['active']
+        analyzers = models['analyzers']
         
-        if len(analyzers) == 0:
-            initialize_models()
+        if not _ready.is_set():
+            return jsonify({'status': 'loading'}), 503
             
         if len(analyzers) == 0:
             return jsonify({'error': 'No data loaded. Please check the server logs.'}), 500
@@ -563,13 +972,17 @@ def get_bowler_performance(bowler_id):
             # If the requested dataset doesn't exist, use the first available
             if analyzers:
                 dataset = list(analyzers.keys())[0]
-                print(f"Requested dataset '{dataset}' not found, using '{dataset}' instead")
+                logger.warning("Requested dataset '%s' not found, using '%s' instead", dataset, dataset)
             else:
                 return jsonify({'error': 'No datasets available. Please check the server logs.'}), 500
             
+        performance_cache = models['performance']
+        cached = performance_cache.get((dataset, bowler_id))
+        if cached is not None:
+            return _cached_json_response(*cached)
+            
         # Get bowler details
-        bowlers = json.loads(get_bowlers().data)
-        bowler = next((b for b in bowlers if str(b['id']) == bowler_id), None)
+        bowler = get_bowler_index(models, dataset).get(bowler_id)
         
         if not bowler:
             return jsonify({'error': 'Bowler not found'}), 404
@@ -584,213 +997,333 @@ def get_bowler_performance(bowler_id):
             'patternRadar': []
         }
         
+        # Set when a section falls back to placeholder data; such responses are
+        # not cached, so the next request tries the real data again
+        fell_back = False
+        
+        # Look up the bowler's rows once and derive all three sections from them.
+        # If that fails, each section below falls back to its defaults.
+        try:
+            bowler_df, pattern_stats, recent_df = analyzer.get_bowler_bundle(bowler['name'])
+        except Exception as e:
+            logger.error("Error getting bowler data: %s", e)
+            bowler_df = pattern_stats = recent_df = None
+            fell_back = True
+        
         # Try to get pattern performance
         try:
-            pattern_stats = analyzer.get_pattern_performance(bowler['name'])
-            print(f"Pattern stats for {bowler['name']}: {pattern_stats.shape if not pattern_stats.empty else 'Empty'}")
+            logger.debug("Pattern stats for %s: %s", bowler['name'], pattern_stats.shape if not pattern_stats.empty else 'Empty')
             
             # Debug pattern stats indices
-            if not pattern_stats.empty:
-                print(f"Pattern stats categories: {pattern_stats.index.tolist()}")
-            
-            # Prepare by_pattern data
-            for category, row in pattern_stats.iterrows():
-                try:
-                    response['byPattern'].append({
-                        'category': str(category),
-                        'avgPosition': float(row['avg_position']) if not pd.isna(row['avg_position']) else 0.0,
-                        'tournamentCount': int(row['tournaments_played']) if not pd.isna(row['tournaments_played']) else 0,
-                        'avgEarnings': float(row['avg_earnings']) if not pd.isna(row['avg_earnings']) else 0.0
-                    })
-                except Exception as e:
-                    print(f"Error processing category {category}: {str(e)}")
-                    # Add a placeholder for this category to avoid breaking the chart
-                    response['byPattern'].append({
-                        'category': str(category),
-                        'avgPosition': 0.0,
-                        'tournamentCount': 0,
-                        'avgEarnings': 0.0
-                    })
+            if not pattern_stats.empty and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Pattern stats categories: %s", pattern_stats.index.tolist())
+            
+            # Prepare by_pattern data column by column; missing stats become 0
+            stats = pattern_stats.reindex(columns=['avg_position', 'tournaments_played', 'avg_earnings']).fillna(0)
+            response['byPattern'] = [
+                {
+                    'category': str(category),
+                    'avgPosition': avg_position,
+                    'tournamentCount': tournament_count,
+                    'avgEarnings': avg_earnings
+                }
+                for category, avg_position, tournament_count, avg_earnings in zip(
+                    stats.index,
+                    stats['avg_position'].to_numpy(dtype=float).tolist(),
+                    stats['tournaments_played'].to_numpy(dtype=int).tolist(),
+                    stats['avg_earnings'].to_numpy(dtype=float).tolist()
+                )
+            ]
         except Exception as e:
-            print(f"Error getting pattern performance: {str(e)}")
+            logger.error("Error getting pattern performance: %s", e)
             # Add default pattern categories if we can't get real data
-            for category in ['Short', 'Medium', 'Long', 'Extra Long']:
-                response['byPattern'].append({
-                    'category': category,
-                    'avgPosition': 0.0,
-                    'tournamentCount': 0,
-                    'avgEarnings': 0.0
-                })
+            response['byPattern'] = list(BY_PATTERN_DEFAULT)
+            fell_back = True
         
         # Get recent tournaments
         try:
-            bowler_df = analyzer.df[analyzer.df['name'] == bowler['name']]
-            if 'start_date' in bowler_df.columns:
-                recent_df = bowler_df.sort_values('start_date', ascending=False).head(15)
+            # Pull each field out as a whole column, with the same fallbacks as before:
+            # a default date, position_numeric then position then 0, and "Unknown" pattern
+            default_date = "2023-01-01"
+            if 'start_date' in recent_df.columns:
+                start = recent_df['start_date']
+                if pd.api.types.is_datetime64_any_dtype(start):
+                    dates = start.dt.strftime('%Y-%m-%d')
+                else:
+                    dates = start.astype(str)
+                dates = dates.where(start.notna(), default_date).tolist()
             else:
-                recent_df = bowler_df.head(15)
-            
-            for i, (_, row) in enumerate(recent_df.iterrows()):
-                # Default values
-                tournament_id = i + 1
-                date = "2023-01-01"  # Default date if missing
-                position = 0
-                pattern = "Unknown"
-                
-                # Try to get actual values with fallbacks
-                try:
-                    if 'start_date' in row and pd.notna(row['start_date']):
-                        if hasattr(row['start_date'], 'strftime'):
-                            date = row['start_date'].strftime('%Y-%m-%d')
-                        else:
-                            date = str(row['start_date'])
-                    
-                    if 'position_numeric' in row and pd.notna(row['position_numeric']):
-                        position = int(row['position_numeric'])
-                    elif 'position' in row and pd.notna(row['position']):
-                        position = int(row['position'])
-                    
-                    if 'pattern_category' in row and pd.notna(row['pattern_category']):
-                        pattern = str(row['pattern_category'])
-                except Exception as e:
-                    print(f"Error processing recent tournament row: {str(e)}")
-                
-                response['recentTrend'].append({
-                    'tournamentId': tournament_id,
+                dates = [default_date] * len(recent_df)
+            
+            positions = pd.Series(0, index=recent_df.index)
+            if 'position' in recent_df.columns:
+                positions = recent_df['position']
+            if 'position_numeric' in recent_df.columns:
+                positions = recent_df['position_numeric'].fillna(positions)
+            positions = positions.fillna(0).astype(int).tolist()
+            
+            if 'pattern_category' in recent_df.columns:
+                categories = recent_df['pattern_category']
+                patterns = categories.astype(str).where(categories.notna(), "Unknown").tolist()
+            else:
+                patterns = ["Unknown"] * len(recent_df)
+            
+            response['recentTrend'] = [
+                {
+                    'tournamentId': i + 1,
                     'date': date,
                     'position': position,
                     'pattern': pattern
-                })
+                }
+                for i, (date, position, pattern) in enumerate(zip(dates, positions, patterns))
+            ]
         except Exception as e:
-            print(f"Error getting recent trends: {str(e)}")
+            logger.error("Error getting recent trends: %s", e)
             # Add dummy data for recent trend
-            for i in range(5):
-                response['recentTrend'].append({
-                    'tournamentId': i + 1,
-                    'date': f"2023-{i+1:02d}-01",
-                    'position': 10 - i,
-                    'pattern': "Unknown"
-                })
+            response['recentTrend'] = list(RECENT_TREND_DEFAULT)
+            fell_back = True
         
         # Calculate radar stats with safe default values
         try:
-            pattern_categories = ['Short', 'Medium', 'Long', 'Extra Long']
+            # Average position by category as a plain dict, read once per request
+            avg_by_category = {}
+            if pattern_stats is not None and not pattern_stats.empty and 'avg_position' in pattern_stats.columns:
+                avg_by_category = pattern_stats['avg_position'].to_dict()
             
-            for category in pattern_categories:
-                value = 50.0  # Default middle value
-                
-                try:
-                    if not pattern_stats.empty and category in pattern_stats.index:
-                        category_stats = pattern_stats.loc[category]
-                        if 'avg_position' in category_stats and pd.notna(category_stats['avg_position']):
-                            value = max(0, 100 - float(category_stats['avg_position']))
-                except Exception as e:
-                    print(f"Error calculating radar value for {category}: {str(e)}")
-                
-                response['patternRadar'].append({
-                    'attribute': f"{category} Patterns",
-                    'value': value
-                })
-            
-            # Add other radar attributes
             # Professional bowler Overall Scoring calculation
             try:
-                bowler_df = analyzer.df[analyzer.df['name'] == bowler['name']]
-    
                 if 'average' in bowler_df.columns:
                     # Filter out zeros and obviously incorrect values, but keep legitimate low scores
-                    avg_data = pd.to_numeric(bowler_df['average'], errors='coerce')
+                    # The analyzer converts 'average' to numeric at load, so this is only a view.
+                    # (NaN compares False, so missing averages drop out with the rest)
+                    avg_data = bowler_df['average'].to_numpy(dtype=np.float64)
                     valid_avg = avg_data[(avg_data > 100) & (avg_data < 300)]  # Reasonable bowling range
         
-                    if len(valid_avg) > 0:
+                    if valid_avg.size > 0:
                         avg_score = valid_avg.mean()
-                        print(f"Bowler {bowler['name']} average from {len(valid_avg)} tournaments: {avg_score}")
+                        logger.debug("Bowler %s average from %s tournaments: %s", bowler['name'], valid_avg.size, avg_score)
             
                         # Professional scale: 200 = 0, 215 = 50, 230 = 100
-                        value = min(100, max(0, (avg_score - 200) * 4))
+                        value = _radar_score((avg_score - 200) * 4)
                     else:
-                        print(f"No valid average data for {bowler['name']}")
-                        value = 60.0  # Slightly above average default for professionals
+                        logger.debug("No valid average data for %s", bowler['name'])
+                        value = 60  # Slightly above average default for professionals
                 else:
-                    print(f"No average column found")
-                    value = 60.0
+                    logger.debug("No average column found")
+                    value = 60
             except Exception as e:
-                print(f"Error calculating overall scoring: {str(e)}")
-                value = 60.0
-            response['patternRadar'].append({'attribute': 'Overall Scoring', 'value': value})
+                logger.error("Error calculating overall scoring: %s", e)
+                value = 60
+                fell_back = True
+            
+            # Build the whole radar list in one go
+            response['patternRadar'] = [
+                {'attribute': f"{category} Patterns", 'value': _radar_value(category, avg_by_category)}
+                for category in PATTERN_CATEGORIES
+            ] + [{'attribute': 'Overall Scoring', 'value': value}]
         except Exception as e:
-            print(f"Error calculating radar stats: {str(e)}")
+            logger.error("Error calculating radar stats: %s", e)
+            fell_back = True
             
             # If radar chart is empty, add default values
             if not response['patternRadar']:
-                for category in ['Short Patterns', 'Medium Patterns', 'Long Patterns', 'Extra Long Patterns', 
-                              'Overall Scoring', 'Earnings Potential']:
-                    response['patternRadar'].append({'attribute': category, 'value': 50.0})
+                response['patternRadar'] = list(RADAR_DEFAULT)
         
         # Print final response structure
-        print(f"byPattern has {len(response['byPattern'])} items")
-        print(f"recentTrend has {len(response['recentTrend'])} items")
-        print(f"patternRadar has {len(response['patternRadar'])} items")
+        logger.debug("byPattern has %s items", len(response['byPattern']))
+        logger.debug("recentTrend has %s items", len(response['recentTrend']))
+        logger.debug("patternRadar has %s items", len(response['patternRadar']))
+        
+        if fell_back:
+            return jsonify(response)
         
-        return jsonify(response)
+        body = jsonify(response).get_data()
+        performance_cache[(dataset, bowler_id)] = (body, _gzip_body(body))
+        return _cached_json_response(*performance_cache[(dataset, bowler_id)])
     except Exception as e:
-        print(f"Error in get_bowler_performance: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({
-            'byPattern': [
-                {'category': 'Short', 'avgPosition': 15.0, 'tournamentCount': 5, 'avgEarnings': 5000.0},
-                {'category': 'Medium', 'avgPosition': 12.0, 'tournamentCount': 8, 'avgEarnings': 7500.0},
-                {'category': 'Long', 'avgPosition': 18.0, 'tournamentCount': 3, 'avgEarnings': 3000.0},
-                {'category': 'Extra Long', 'avgPosition': 20.0, 'tournamentCount': 2, 'avgEarnings': 2000.0}
-            ],
-            'recentTrend': [
-                {'tournamentId': 1, 'date': '2023-01-01', 'position': 15, 'pattern': 'Medium'},
-                {'tournamentId': 2, 'date': '2023-02-01', 'position': 10, 'pattern': 'Short'},
-                {'tournamentId': 3, 'date': '2023-03-01', 'position': 5, 'pattern': 'Medium'},
-                {'tournamentId': 4, 'date': '2023-04-01', 'position': 8, 'pattern': 'Long'},
-                {'tournamentId': 5, 'date': '2023-05-01', 'position': 12, 'pattern': 'Medium'}
-            ],
-            'patternRadar': [
-                {'attribute': 'Short Patterns', 'value': 60.0},
-                {'attribute': 'Medium Patterns', 'value': 70.0},
-                {'attribute': 'Long Patterns', 'value': 50.0},
-                {'attribute': 'Extra Long Patterns', 'value': 40.0},
-                {'attribute': 'Match Play Win %', 'value': 65.0},
-                {'attribute': 'Earnings Potential', 'value': 55.0}
-            ]
-        }), 200  # Return default data instead of error
+        logger.exception("Error in get_bowler_performance: %s", e)
+        # Return default data instead of error
+        response = app.response_class(DEFAULT_PERFORMANCE_JSON, mimetype='application/json')
+        response.set_etag(DEFAULT_PERFORMANCE_ETAG)
+        return response.make_conditional(request)
+
+# Longest exception message returned in an error response; scraper errors can
+# carry whole pages of HTML
+MAX_ERROR_MESSAGE = 512
+
+def _error_message(e):
+    """Exception message for an error response, truncated to MAX_ERROR_MESSAGE characters"""
+    return str(e)[:MAX_ERROR_MESSAGE]
+
+# Result counts of recent collection runs keyed by their sorted years. A repeat
+# request for the same years within COLLECT_CACHE_SECONDS is answered from here
+# without scraping or reloading again, unless it passes ?refresh=1.
+COLLECT_CACHE_SECONDS = 3600
+_collect_cache = {}
+
+# Collection jobs by id, oldest first, for /api/data/collect/status/<job_id>.
+# Only the most recent MAX_COLLECT_JOBS are kept.
+MAX_COLLECT_JOBS = 100
+_collect_jobs = {}
+# Id of the queued or running job for each set of years, so duplicate requests share it
+_collect_pending = {}
+# Guards the three dicts above between request threads and the collection job
+_collect_lock = threading.Lock()
+
+def _collect_and_reload(years, key):
+    """
+    Run the data collection pipeline for a job, then reload the models from the new data
+    Returns the number of results collected
+    """
+    try:
+        results = run_data_collection_pipeline(years)
+        # The current models keep serving until the reload replaces them. Only a
+        # successful reload is cached, so repeat requests see the new data live.
+        if not _load_models():
+            raise RuntimeError(f"Collected {len(results)} results for years {years}, but reloading the models failed")
+        with _collect_lock:
+            # Forget expired runs so the cache only holds recent ones
+            now = time.monotonic()
+            for stale in [k for k, (collected_at, _) in _collect_cache.items() if now - collected_at >= COLLECT_CACHE_SECONDS]:
+                del _collect_cache[stale]
+            _collect_cache[key] = (now, len(results))
+    except Exception as e:
+        # The job's status route reports the error; log the traceback here
+        logger.exception("Data collection for years %s failed: %s", years, e)
+        raise
+    finally:
+        with _collect_lock:
+            _collect_pending.pop(key, None)
+    
+    return len(results)
+
+def _parse_years(years):
+    """
+    Validate the years of a collection request: a non-empty list of ints or
+    numeric strings, returned as ints without duplicates
+    Raises ValueError for anything else
+    """
+    if not isinstance(years, list) or not years:
+        raise ValueError("years must be a non-empty list of years")
+    
+    parsed = []
+    for year in years:
+        # bool is an int subclass, but true/false are not years
+        if isinstance(year, bool) or not isinstance(year, (int, str)) or not str(year).strip().isdigit():
+            raise ValueError(f"Invalid year: {year!r}")
+        parsed.append(int(year))
+    return list(dict.fromkeys(parsed))
 
 @app.route('/api/data/collect', methods=['POST'])
 def api_collect_data():
-    """API endpoint to trigger data collection"""
+    """
+    API endpoint to trigger data collection
+    The scrape and model reload run in the background; the response carries a job id
+    to poll at /api/data/collect/status/<job_id>
+    """
     try:
         data = request.json
-        years = data.get('years', [datetime.now().year])
-        
-        # Run data collection pipeline
-        results = run_data_collection_pipeline(years)
+        try:
+            years = _parse_years(data.get('years', [datetime.now().year]))
+        except ValueError as e:
+            return jsonify({'error': _error_message(e)}), 400
+        key = tuple(sorted(years))
+        refresh = request.args.get('refresh', '0') != '0'
         
-        # Re-initialize models
-        initialize_models()
+        with _collect_lock:
+            cached = _collect_cache.get(key)
+            if cached is not None and not refresh and time.monotonic() - cached[0] < COLLECT_CACHE_SECONDS:
+                return jsonify({
+                    'status': 'success',
+                    'message': f'Data for years {years} was already collected',
+                    'count': cached[1],
+                    'cached': True
+                }), 200
+            
+            # Join a queued or running job for the same years instead of starting another
+            job_id = _collect_pending.get(key)
+            if job_id is None:
+                job_id = uuid.uuid4().hex
+                _collect_jobs[job_id] = _reload_executor.submit(_collect_and_reload, years, key)
+                _collect_pending[key] = job_id
+                
+                # Drop the oldest finished jobs beyond the limit
+                finished = [j for j, future in _collect_jobs.items() if future.done()]
+                for old in finished[:max(0, len(_collect_jobs) - MAX_COLLECT_JOBS)]:
+                    del _collect_jobs[old]
         
         return jsonify({
-            'status': 'success',
-            'message': f'Collected data for years: {years}',
-            'count': len(results)
-        })
+            'status': 'queued',
+            'message': f'Collecting data for years: {years}',
+            'job_id': job_id,
+            'cached': False
+        }), 202
     except Exception as e:
-        print(f"Error in api_collect_data: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'error': str(e)}), 500
+        logger.exception("Error in api_collect_data: %s", e)
+        return jsonify({'error': _error_message(e)}), 500
+
+@app.route('/api/data/collect/status/<job_id>', methods=['GET'])
+def api_collect_job_status(job_id):
+    """Report the progress of one data collection job"""
+    future = _collect_jobs.get(job_id)
+    if future is None:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    if not future.done():
+        return jsonify({
+            'job_id': job_id,
+            'status': 'running' if future.running() else 'queued',
+            'done': False
+        })
+    
+    error = future.exception()
+    if error is not None:
+        return jsonify({'job_id': job_id, 'status': 'error', 'done': True, 'error': _error_message(error)})
+    return jsonify({'job_id': job_id, 'status': 'done', 'done': True, 'count': future.result()})
+
+@app.route('/api/data/collect/status', methods=['GET'])
+def api_collect_status():
+    """Report whether every data collection job, including its model reload, has finished"""
+    with _collect_lock:
+        pending = [job_id for job_id, future in _collect_jobs.items() if not future.done()]
+    done = not pending
+    return jsonify({
+        'status': 'ready' if done else 'loading',
+        'done': done,
+        'pending_jobs': pending
+    })
+
+@app.route('/api/cache/invalidate', methods=['POST'])
+def api_cache_invalidate():
+    """Drop the cached lists and responses so they are rebuilt from the loaded data"""
+    clear_caches()
+    return jsonify({'status': 'cleared'})
+
+# Request threads when serving with waitress from `python data_pipeline.py`
+WAITRESS_THREADS = 8
+
+# Load the data in a background thread so the server answers right away;
+# routes return 503 until the first load has finished
+threading.Thread(target=_load_models, daemon=True).start()
 
 if __name__ == '__main__':
-    # Initialize models
-    if initialize_models():
-        print("Models initialized successfully!")
-    else:
-        print("Warning: Failed to initialize models. API routes may not work correctly.")
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Serve the PBA analysis API on port 5000")
+    parser.add_argument("--dev", action="store_true",
+                        help="Use Flask's development server, with the debugger and reloader unless PBA_DEBUG=0")
+    args = parser.parse_args()
     
-    # Start the Flask app
-    app.run(debug=True, port=5000)
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None
+    
+    if args.dev or serve is None:
+        if not args.dev:
+            print("waitress is not installed, falling back to Flask's development server")
+        app.run(debug=os.environ.get('PBA_DEBUG', '1') != '0', port=5000)
+    else:
+        # Multithreaded WSGI server; for multiple processes use gunicorn (see README)
+        print("Serving the API with waitress on http://127.0.0.1:5000")
+        serve(app, host='127.0.0.1', port=5000, threads=WAITRESS_THREADS)
@@ -5,14 +5,38 @@ import seaborn as sns
 from datetime import datetime, timedelta
 import os
 
+def _weighted_total_score(scores, avg_scores, exps, position_weights, average_weights):
+    """
+    Combine per-factor position and average scores into one total per bowler
+    
+    Each argument holds one row per factor (pattern, center, length, overall).
+    A factor's scores count in proportion to the bowler's experience there, and
+    the total is normalized by the weights of the factors the bowler has played.
+    """
+    weighted_sum = np.zeros(scores.shape[1])
+    total_weight = np.zeros(scores.shape[1])
+    for i in range(scores.shape[0]):
+        weighted_sum += scores[i] * exps[i] * position_weights[i]
+        weighted_sum += avg_scores[i] * exps[i] * average_weights[i]
+        total_weight += (exps[i] > 0) * (position_weights[i] + average_weights[i])
+    
+    # Avoid division by zero
+    return weighted_sum / np.where(total_weight == 0, 1.0, total_weight)
+
 class PBAAnalyzer:
-    def __init__(self, data_path="data/combined_pba_data_cleaned.csv"):
+    def __init__(self, data_path="data/combined_pba_data_cleaned.csv", df=None):
         """
-        Initialize with path to combined PBA data
+        Initialize with path to combined PBA data, or with an already loaded
+        DataFrame (copied, since preprocessing modifies it)
         """
-        print(f"Loading data from {data_path}...")
-        self.df = pd.read_csv(data_path)
+        if df is None:
+            print(f"Loading data from {data_path}...")
+            self.df = pd.read_csv(data_path)
+        else:
+            self.df = df.copy()
         self._preprocess_data()
+        # Row positions of each bowler's results, built on the first per-bowler lookup
+        self._rows_by_name = None
         
     def _preprocess_data(self):
         """
@@ -62,6 +86,15 @@ class PBAAnalyzer:
                 total_matches = self.df['mp_wins'].fillna(0) + self.df['mp_losses'].fillna(0) + self.df['mp_ties'].fillna(0)
                 self.df['win_percentage'] = np.where(total_matches > 0, self.df['mp_wins'] / total_matches * 100, np.nan)
                 
+        # Categorize patterns by length once at load, so analyses and API requests
+        # never have to re-bin. Short: 0-36, Medium: 37-41, Long: 42-47, Extra Long: 48+
+        if 'pattern_category' not in self.df.columns and 'pattern_length' in self.df.columns:
+            self.df['pattern_category'] = pd.cut(
+                self.df['pattern_length'],
+                bins=[0, 36, 41, 47, 100],
+                labels=['Short', 'Medium', 'Long', 'Extra Long']
+            )
+        
         # Add a timestamp field for recency calculations - ensure timezone-naive
         self.df['timestamp'] = self.df['start_date']
         if not self.df['timestamp'].empty and pd.notna(self.df['timestamp'].iloc[0]):
@@ -74,9 +107,14 @@ class PBAAnalyzer:
             print(f"Full dataset contains {len(self.df)} results")
             self.df = self.df[self.df['tournament_tier'].isin(['Major', 'Standard'])]
             print(f"Filtered dataset (excluding qualifiers) contains {len(self.df)} results")
-            
+
+        # The columns above were added one at a time, each in its own block.
+        # A deep copy consolidates them so per-request row gathers touch one
+        # contiguous block per dtype.
+        self.df = self.df.copy()
+
         # Print pattern distributions
-        pattern_counts = self.df.groupby('pattern_name').size().sort_values(ascending=False)
+        pattern_counts = self.df.groupby('pattern_name', observed=True).size().sort_values(ascending=False)
         if len(pattern_counts) > 0:
             print("Top patterns in dataset:")
             for pattern, count in pattern_counts.head(5).items():
@@ -97,7 +135,7 @@ class PBAAnalyzer:
             print(f"Using all available data ({len(df)} results)")
             
         # Group by bowler name and calculate stats
-        stats = df.groupby('name').agg({
+        stats = df.groupby('name', observed=True).agg({
             'tournament_name': 'count',
             'position': ['mean', 'min', 'median'],
             'earnings': ['sum', 'mean'],
@@ -116,7 +154,7 @@ class PBAAnalyzer:
         ]
         
         # Calculate percentage of tournaments in the top 5
-        top5_counts = df[df['position'] <= 5].groupby('name').size()
+        top5_counts = df[df['position'] <= 5].groupby('name', sort=False, observed=True).size()
         # Merge with stats
         if not top5_counts.empty:
             stats = stats.join(top5_counts.rename('top5_finishes'), how='left')
@@ -126,7 +164,7 @@ class PBAAnalyzer:
             stats['top5_percentage'] = 0
         
         # Calculate wins (position = 1)
-        win_counts = df[df['position'] == 1].groupby('name').size()
+        win_counts = df[df['position'] == 1].groupby('name', sort=False, observed=True).size()
         # Merge with stats
         if not win_counts.empty:
             stats = stats.join(win_counts.rename('wins'), how='left')
@@ -196,7 +234,7 @@ class PBAAnalyzer:
         print(f"Found {len(pattern_df)} results for pattern across {pattern_df['tournament_name'].nunique()} tournaments")
             
         # Group by bowler and compute stats
-        stats = pattern_df.groupby('name').agg({
+        stats = pattern_df.groupby('name', observed=True).agg({
             'tournament_name': 'count',
             'position': ['mean', 'min'],
             'earnings': ['sum', 'mean'],
@@ -214,7 +252,7 @@ class PBAAnalyzer:
         ]
         
         # Calculate top 5 finishes
-        top5_counts = pattern_df[pattern_df['position'] <= 5].groupby('name').size()
+        top5_counts = pattern_df[pattern_df['position'] <= 5].groupby('name', sort=False, observed=True).size()
         if not top5_counts.empty:
             stats = stats.join(top5_counts.rename('top5_finishes'), how='left')
             stats['top5_percentage'] = (stats['top5_finishes'] / stats['tournaments_played'] * 100).fillna(0)
@@ -223,7 +261,7 @@ class PBAAnalyzer:
             stats['top5_percentage'] = 0
             
         # Calculate wins
-        win_counts = pattern_df[pattern_df['position'] == 1].groupby('name').size()
+        win_counts = pattern_df[pattern_df['position'] == 1].groupby('name', sort=False, observed=True).size()
         if not win_counts.empty:
             stats = stats.join(win_counts.rename('wins'), how='left')
             stats['win_percentage'] = (stats['wins'] / stats['tournaments_played'] * 100).fillna(0)
@@ -294,7 +332,7 @@ class PBAAnalyzer:
             print(f"  {pattern_len}ft: {count} results")
             
         # Group by bowler and compute stats
-        stats = pattern_df.groupby('name').agg({
+        stats = pattern_df.groupby('name', observed=True).agg({
             'tournament_name': 'count',
             'position': ['mean', 'min'],
             'earnings': ['sum', 'mean'],
@@ -312,7 +350,7 @@ class PBAAnalyzer:
         ]
         
         # Calculate top 5 finishes
-        top5_counts = pattern_df[pattern_df['position'] <= 5].groupby('name').size()
+        top5_counts = pattern_df[pattern_df['position'] <= 5].groupby('name', sort=False, observed=True).size()
         if not top5_counts.empty:
             stats = stats.join(top5_counts.rename('top5_finishes'), how='left')
             stats['top5_percentage'] = (stats['top5_finishes'] / stats['tournaments_played'] * 100).fillna(0)
@@ -321,7 +359,7 @@ class PBAAnalyzer:
             stats['top5_percentage'] = 0
             
         # Calculate wins
-        win_counts = pattern_df[pattern_df['position'] == 1].groupby('name').size()
+        win_counts = pattern_df[pattern_df['position'] == 1].groupby('name', sort=False, observed=True).size()
         if not win_counts.empty:
             stats = stats.join(win_counts.rename('wins'), how='left')
             stats['win_percentage'] = (stats['wins'] / stats['tournaments_played'] * 100).fillna(0)
@@ -375,7 +413,7 @@ class PBAAnalyzer:
         print(f"Found {len(center_df)} results at '{center_name}' across {center_df['tournament_name'].nunique()} tournaments")
             
         # Group by bowler and compute stats
-        stats = center_df.groupby('name').agg({
+        stats = center_df.groupby('name', observed=True).agg({
             'tournament_name': 'count',
             'position': ['mean', 'min'],
             'earnings': ['sum', 'mean'],
@@ -393,7 +431,7 @@ class PBAAnalyzer:
         ]
         
         # Calculate top 5 finishes
-        top5_counts = center_df[center_df['position'] <= 5].groupby('name').size()
+        top5_counts = center_df[center_df['position'] <= 5].groupby('name', sort=False, observed=True).size()
         if not top5_counts.empty:
             stats = stats.join(top5_counts.rename('top5_finishes'), how='left')
             stats['top5_percentage'] = (stats['top5_finishes'] / stats['tournaments_played'] * 100).fillna(0)
@@ -402,7 +440,7 @@ class PBAAnalyzer:
             stats['top5_percentage'] = 0
             
         # Calculate wins
-        win_counts = center_df[center_df['position'] == 1].groupby('name').size()
+        win_counts = center_df[center_df['position'] == 1].groupby('name', sort=False, observed=True).size()
         if not win_counts.empty:
             stats = stats.join(win_counts.rename('wins'), how='left')
             stats['win_percentage'] = (stats['wins'] / stats['tournaments_played'] * 100).fillna(0)
@@ -466,8 +504,10 @@ class PBAAnalyzer:
             # Get pattern length if available
             if not pattern_stats.empty:
                 pattern_rows = self.df[self.df['pattern_name'].str.lower() == pattern_name.lower()]
-                if not pattern_rows.empty and pd.notna(pattern_rows['pattern_length'].iloc[0]):
-                    pattern_length_value = float(pattern_rows['pattern_length'].iloc[0])
+                # Read the first row's length once as a scalar
+                first_length = pattern_rows['pattern_length'].iat[0] if not pattern_rows.empty else np.nan
+                if pd.notna(first_length):
+                    pattern_length_value = float(first_length)
                     print(f"Pattern length: {pattern_length_value}ft")
                     
         elif pattern_length:
@@ -519,69 +559,30 @@ class PBAAnalyzer:
         # Create prediction dataframe with properly initialized columns
         predictions = pd.DataFrame(index=all_bowlers)
         
-        # Add tournament counts for each factor
-        predictions['pattern_tournaments'] = 0
-        if not pattern_stats.empty:
-            for idx in pattern_stats.index:
-                if idx in predictions.index:
-                    predictions.at[idx, 'pattern_tournaments'] = int(pattern_stats.at[idx, 'tournaments_played'])
-        
-        predictions['center_tournaments'] = 0
-        if not center_stats.empty:
-            for idx in center_stats.index:
-                if idx in predictions.index:
-                    predictions.at[idx, 'center_tournaments'] = int(center_stats.at[idx, 'tournaments_played'])
-        
-        predictions['length_tournaments'] = 0
-        if not length_stats.empty:
-            for idx in length_stats.index:
-                if idx in predictions.index:
-                    predictions.at[idx, 'length_tournaments'] = int(length_stats.at[idx, 'tournaments_played'])
-        
-        predictions['overall_tournaments'] = 0
-        for idx in overall_stats.index:
-            if idx in predictions.index:
-                predictions.at[idx, 'overall_tournaments'] = int(overall_stats.at[idx, 'tournaments_played'])
+        # Align each factor's tallies to the bowler list with one reindex per column
+        # (bowlers missing from a factor get 0 tournaments and a NaN position/average)
+        factor_stats = {
+            'pattern': pattern_stats,
+            'center': center_stats,
+            'length': length_stats,
+            'overall': overall_stats
+        }
+        for factor, stats_df in factor_stats.items():
+            predictions[f'{factor}_tournaments'] = 0
+            if not stats_df.empty:
+                predictions[f'{factor}_tournaments'] = (
+                    stats_df['tournaments_played'].reindex(predictions.index).fillna(0).astype(int)
+                )
         
         # Add position stats for each factor (these will be normalized later)
-        predictions['pattern_position'] = np.nan  # Use NaN instead of 999
-        predictions['pattern_average'] = np.nan  # Add game average for patterns
-        if not pattern_stats.empty:
-            for idx in pattern_stats.index:
-                if idx in predictions.index:
-                    predictions.at[idx, 'pattern_position'] = float(pattern_stats.at[idx, 'avg_position'])
-                    # Add average score if available
-                    if 'avg_game_score' in pattern_stats.columns:
-                        predictions.at[idx, 'pattern_average'] = float(pattern_stats.at[idx, 'avg_game_score'])
-        
-        predictions['center_position'] = np.nan
-        predictions['center_average'] = np.nan # Add game average for centers
-        if not center_stats.empty:
-            for idx in center_stats.index:
-                if idx in predictions.index:
-                    predictions.at[idx, 'center_position'] = float(center_stats.at[idx, 'avg_position'])
-                    # Add average score if available
-                    if 'avg_game_score' in center_stats.columns:
-                        predictions.at[idx, 'center_average'] = float(center_stats.at[idx, 'avg_game_score'])
-        
-        predictions['length_position'] = np.nan
-        predictions['length_average'] = np.nan # Add game average for length
-        if not length_stats.empty:
-            for idx in length_stats.index:
-                if idx in predictions.index:
-                    predictions.at[idx, 'length_position'] = float(length_stats.at[idx, 'avg_position'])
-                    # Add average score if available
-                    if 'avg_game_score' in length_stats.columns:
-                        predictions.at[idx, 'length_average'] = float(length_stats.at[idx, 'avg_game_score'])
-        
-        predictions['overall_position'] = np.nan
-        predictions['overall_average'] = np.nan # Add overall average
-        for idx in overall_stats.index:
-            if idx in predictions.index:
-                predictions.at[idx, 'overall_position'] = float(overall_stats.at[idx, 'avg_position'])
+        for factor, stats_df in factor_stats.items():
+            predictions[f'{factor}_position'] = np.nan  # Use NaN instead of 999
+            predictions[f'{factor}_average'] = np.nan  # Add game average
+            if not stats_df.empty:
+                predictions[f'{factor}_position'] = stats_df['avg_position'].reindex(predictions.index).astype(float)
                 # Add average score if available
-                if 'avg_game_score' in overall_stats.columns:
-                    predictions.at[idx, 'overall_average'] = float(overall_stats.at[idx, 'avg_game_score'])
+                if 'avg_game_score' in stats_df.columns:
+                    predictions[f'{factor}_average'] = stats_df['avg_game_score'].reindex(predictions.index).astype(float)
         
         # Calculate experience factors (more experience = more reliable prediction)
         max_pattern = predictions['pattern_tournaments'].max() if predictions['pattern_tournaments'].max() > 0 else 1
@@ -653,37 +654,21 @@ class PBAAnalyzer:
             'overall_average': 0.05   # New weight for average score
         }
         
-        # Calculate weighted scores based on experience
+        # Calculate weighted scores based on experience on the raw column arrays
         # If a bowler has no experience in a category, that weight is redistributed
-        predictions['weighted_pattern_pos'] = predictions['pattern_score'] * predictions['pattern_exp'] * weights['pattern_position']
-        predictions['weighted_pattern_avg'] = predictions['pattern_avg_score'] * predictions['pattern_exp'] * weights['pattern_average']
-        predictions['weighted_center_pos'] = predictions['center_score'] * predictions['center_exp'] * weights['center_position']
-        predictions['weighted_center_avg'] = predictions['center_avg_score'] * predictions['center_exp'] * weights['center_average']
-        predictions['weighted_length_pos'] = predictions['length_score'] * predictions['length_exp'] * weights['length_position']
-        predictions['weighted_length_avg'] = predictions['length_avg_score'] * predictions['length_exp'] * weights['length_average']
-        predictions['weighted_overall_pos'] = predictions['overall_score'] * weights['overall_position']  # Always have overall data
-        predictions['weighted_overall_avg'] = predictions['overall_avg_score'] * weights['overall_average']  # Always have overall data
-        
-        # Get total applied weight
-        predictions['total_weight'] = (
-            (predictions['pattern_exp'] > 0) * (weights['pattern_position'] + weights['pattern_average']) +
-            (predictions['center_exp'] > 0) * (weights['center_position'] + weights['center_average']) +
-            (predictions['length_exp'] > 0) * (weights['length_position'] + weights['length_average']) +
-            (weights['overall_position'] + weights['overall_average'])  # Always include overall weights
+        factors = ['pattern', 'center', 'length', 'overall']
+        score_cols = ['pattern_score', 'center_score', 'length_score', 'overall_score']
+        avg_cols = ['pattern_avg_score', 'center_avg_score', 'length_avg_score', 'overall_avg_score']
+        exps = predictions[[f'{factor}_exp' for factor in factors]].to_numpy(dtype=float).T
+        exps[3] = 1.0  # Always have overall data
+        predictions['total_score'] = _weighted_total_score(
+            predictions[score_cols].to_numpy(dtype=float).T,
+            predictions[avg_cols].to_numpy(dtype=float).T,
+            exps,
+            np.array([weights[f'{factor}_position'] for factor in factors]),
+            np.array([weights[f'{factor}_average'] for factor in factors])
         )
         
-        # Total score normalized by applied weights
-        predictions['total_score'] = (
-            predictions['weighted_pattern_pos'] + 
-            predictions['weighted_pattern_avg'] + 
-            predictions['weighted_center_pos'] + 
-            predictions['weighted_center_avg'] + 
-            predictions['weighted_length_pos'] + 
-            predictions['weighted_length_avg'] + 
-            predictions['weighted_overall_pos'] + 
-            predictions['weighted_overall_avg']
-        ) / predictions['total_weight'].replace(0, 1.0)  # Avoid division by zero
-        
         # Clean up NaN values (if a bowler has no data in any category)
         predictions = predictions.fillna(0.0)
         
@@ -724,20 +709,13 @@ class PBAAnalyzer:
             'total_score', 'confidence'
         ]
         
-        # Get top 5 percentages if available
+        # Get top 5 percentages if available, aligned to the ranked names in one pass
+        top_predictions = top_predictions.copy()
         if not pattern_stats.empty:
-            top_predictions['pattern_top5'] = np.nan
-            for name in top_predictions['name']:
-                if name in pattern_stats.index:
-                    idx = top_predictions.index[top_predictions['name'] == name][0]
-                    top_predictions.loc[idx, 'pattern_top5'] = pattern_stats.loc[name, 'top5_percentage']
+            top_predictions['pattern_top5'] = pattern_stats['top5_percentage'].reindex(top_predictions['name']).to_numpy()
         
         if not center_stats.empty:
-            top_predictions['center_top5'] = np.nan
-            for name in top_predictions['name']:
-                if name in center_stats.index:
-                    idx = top_predictions.index[top_predictions['name'] == name][0]
-                    top_predictions.loc[idx, 'center_top5'] = center_stats.loc[name, 'top5_percentage']
+            top_predictions['center_top5'] = center_stats['top5_percentage'].reindex(top_predictions['name']).to_numpy()
             
         result = top_predictions[display_columns].copy()
         
@@ -830,11 +808,38 @@ class PBAAnalyzer:
         
         return plt
     
-    def get_pattern_performance(self, bowler_name, min_tournaments=1):
+    def get_bowler_rows(self, bowler_name):
+        """
+        Get all result rows for one bowler
+        Uses a name -> row positions index instead of scanning the name column each call
+        """
+        if self._rows_by_name is None:
+            self._rows_by_name = self.df.groupby('name', sort=False, observed=True).indices
+        return self.df.iloc[self._rows_by_name.get(bowler_name, [])]
+    
+    def get_bowler_bundle(self, bowler_name, recent_count=15):
+        """
+        Get a bowler's rows, stats by pattern category and most recent results
+        from a single lookup of the bowler's rows
+        Returns (all rows, pattern stats, most recent rows by start_date)
+        """
+        bowler_df = self.get_bowler_rows(bowler_name)
+        pattern_stats = self.get_pattern_performance(bowler_name, bowler_df=bowler_df)
+        
+        if 'start_date' in bowler_df.columns:
+            recent_df = bowler_df.sort_values('start_date', ascending=False).head(recent_count)
+        else:
+            recent_df = bowler_df.head(recent_count)
+        
+        return bowler_df, pattern_stats, recent_df
+    
+    def get_pattern_performance(self, bowler_name, min_tournaments=1, bowler_df=None):
         """
         Analyze a bowler's performance on different pattern categories
+        bowler_df can pass in the bowler's rows if they were already looked up
         """
-        bowler_df = self.df[self.df['name'] == bowler_name]
+        if bowler_df is None:
+            bowler_df = self.get_bowler_rows(bowler_name)
     
         if len(bowler_df) == 0:
             print(f"No data found for bowler: {bowler_name}")
@@ -860,35 +865,31 @@ class PBAAnalyzer:
     
         # Group by pattern category with observed=True to handle categorical data properly
         try:
-            pattern_stats = bowler_df.groupby('pattern_category', observed=True).agg({
-                'tournament_name': 'count',
-                'position': ['mean', 'min', 'median'],
-                'earnings': ['sum', 'mean'],
-                'average': 'mean',
-                'pattern_length': 'mean'
-            })
-        
-            # Rename columns
-            pattern_stats.columns = [
-                'tournaments_played',
-                'avg_position',
-                'best_position',
-                'median_position',
-                'total_earnings',
-                'avg_earnings',
-                'avg_game_score',
-                'avg_pattern_length'
-            ]
-        
-            # Calculate top 5 finishes by pattern
-            top5_by_pattern = bowler_df[bowler_df['position'] <= 5].groupby('pattern_category', observed=True).size()
-            pattern_stats = pattern_stats.join(top5_by_pattern.rename('top5_finishes'), how='left')
-            pattern_stats['top5_percentage'] = (pattern_stats['top5_finishes'] / pattern_stats['tournaments_played'] * 100).fillna(0)
-        
-            # Calculate wins by pattern
-            wins_by_pattern = bowler_df[bowler_df['position'] == 1].groupby('pattern_category', observed=True).size()
-            pattern_stats = pattern_stats.join(wins_by_pattern.rename('wins'), how='left')
-            pattern_stats['win_percentage'] = (pattern_stats['wins'] / pattern_stats['tournaments_played'] * 100).fillna(0)
+            # One pass computes the stats, top 5 finishes and wins per category
+            flagged = bowler_df.assign(
+                is_top5=bowler_df['position'] <= 5,
+                is_win=bowler_df['position'] == 1
+            )
+            pattern_stats = flagged.groupby('pattern_category', observed=True).agg(
+                tournaments_played=('tournament_name', 'count'),
+                avg_position=('position', 'mean'),
+                best_position=('position', 'min'),
+                median_position=('position', 'median'),
+                total_earnings=('earnings', 'sum'),
+                avg_earnings=('earnings', 'mean'),
+                avg_game_score=('average', 'mean'),  # Added average score
+                avg_pattern_length=('pattern_length', 'mean'),
+                top5_finishes=('is_top5', 'sum'),
+                wins=('is_win', 'sum')
+            )
+        
+            # Top 5 and win rates by pattern
+            pattern_stats.insert(
+                pattern_stats.columns.get_loc('top5_finishes') + 1,
+                'top5_percentage',
+                pattern_stats['top5_finishes'] / pattern_stats['tournaments_played'] * 100
+            )
+            pattern_stats['win_percentage'] = pattern_stats['wins'] / pattern_stats['tournaments_played'] * 100
         
             # Fill NaN values with 0
             pattern_stats = pattern_stats.fillna(0)
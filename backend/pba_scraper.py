@@ -7,6 +7,11 @@ import os
 from datetime import datetime
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # save_results falls back to the stdlib json module
+
 class PBAScraper:
     def __init__(self):
         self.base_url = "https://www.pba.com"
@@ -1304,8 +1309,13 @@ class PBAScraper:
         """
         Saves results to JSON file
         """
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
+        if orjson is not None:
+            # orjson formats the indented output in C and writes it as bytes
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(results, f, indent=2)
             
     def save_to_csv(self, results, filename):
         """
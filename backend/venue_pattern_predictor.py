@@ -3,15 +3,19 @@ import numpy as np
 from datetime import datetime, timedelta
 
 class VenuePatternPredictor:
-    def __init__(self, data_path):
+    def __init__(self, data_path, df=None):
         """
         Initialize the predictor with tournament data
         
         Args:
             data_path: Path to the CSV file with tournament data
+            df: Already loaded tournament data; copied and used instead of reading data_path
         """
-        print(f"Loading data for prediction from {data_path}...")
-        self.df = pd.read_csv(data_path)
+        if df is None:
+            print(f"Loading data for prediction from {data_path}...")
+            self.df = pd.read_csv(data_path)
+        else:
+            self.df = df.copy()
         self.model = None
         self._preprocess_data()
         
@@ -109,7 +113,7 @@ class VenuePatternPredictor:
         
         # Get center experience for each bowler
         if filter_by_center and len(center_data) > 0:
-            center_experience = center_data.groupby('name').size().reset_index(name='center_experience')
+            center_experience = center_data.groupby('name', sort=False, observed=True).size().reset_index(name='center_experience')
         else:
             # Create empty DataFrame with same structure
             center_experience = pd.DataFrame({'name': [], 'center_experience': []})
@@ -130,7 +134,7 @@ class VenuePatternPredictor:
         
         # Get pattern performance for each bowler
         if 'position_numeric' in pattern_data.columns:
-            pattern_performance = pattern_data.groupby('name').agg({
+            pattern_performance = pattern_data.groupby('name', sort=False, observed=True).agg({
                 'position_numeric': ['mean', 'count']
             })
             pattern_performance.columns = ['avg_position_on_pattern', 'pattern_experience']
@@ -145,7 +149,7 @@ class VenuePatternPredictor:
         
         # Get overall performance stats for all bowlers
         if 'position_numeric' in self.df.columns:
-            overall_performance = self.df.groupby('name').agg({
+            overall_performance = self.df.groupby('name', observed=True).agg({
                 'position_numeric': ['mean', 'count']
             })
             overall_performance.columns = ['avg_position_overall', 'total_tournaments']
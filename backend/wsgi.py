@@ -0,0 +1,10 @@
+# WSGI entry point for serving the API with gunicorn's --preload, run from the backend directory:
+#   gunicorn -w 4 -k gthread --threads 8 --preload wsgi:app
+#
+# Importing data_pipeline starts the model load in a background thread, which
+# would not survive gunicorn forking the workers. Waiting for it here means the
+# workers are forked with the models already loaded and share them copy-on-write
+# instead of each loading its own copy.
+from data_pipeline import app, _ready
+
+_ready.wait()